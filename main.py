@@ -112,7 +112,7 @@ Beispiele:
         args.max_pages = 2  # Begrenzt auf 2 Seiten im Test-Modus
 
     # Browser Manager initialisieren
-    browser_manager = BrowserManager(headless=args.headless)
+    browser_manager = await BrowserManager.create(headless=args.headless)
 
     # CSV Exporter initialisieren
     csv_exporter = CSVExporter(output_directory=args.output_dir)
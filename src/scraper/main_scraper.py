@@ -10,10 +10,11 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import random
 
-import yaml
+from playwright.async_api import Page
 
 from ..utils.browser_manager import BrowserManager
 from ..utils.logging_config import ScraperLogger, get_logger
+from ..utils.yaml_cache import load_yaml_cached, thaw
 from .navigator import Navigator, NavigationError
 from .data_extractor import DataExtractor, CompanyData
 from .email_extractor import EmailExtractor
@@ -61,8 +62,8 @@ class MainScraper:
     def _load_config(self) -> Dict[str, Any]:
         """Lädt die Konfiguration aus der YAML-Datei"""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                return yaml.safe_load(file)
+            # Eigene Kopie - run_complete_scraping überschreibt Werte
+            return thaw(load_yaml_cached(self.config_path))
         except Exception as e:
             print(f"Warning: Could not load config from {self.config_path}: {e}")
             return self._get_default_config()
@@ -100,7 +101,9 @@ class MainScraper:
             page = await self.browser_manager.get_or_create_page()
 
             # Komponenten mit der Page initialisieren
-            self.navigator = Navigator(page, self.config)
+            self.navigator = Navigator(
+                page, self.config, page_factory=self.browser_manager.new_page
+            )
             self.data_extractor = DataExtractor(page, self.config)
             self.email_extractor = EmailExtractor(page, self.config)
             self.pagination_handler = PaginationHandler(page, self.config)
@@ -108,7 +111,7 @@ class MainScraper:
             self.logger.info("All scraper components initialized successfully")
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize scraper components: {e}")
+            self.logger.error("Failed to initialize scraper components: %s", e)
             raise
 
     async def scrape_companies(
@@ -160,7 +163,7 @@ class MainScraper:
                 return self.get_statistics()
 
             self.stats["companies_found"] = len(all_companies)
-            self.logger.info(f"Found {len(all_companies)} companies total")
+            self.logger.info("Found %d companies total", len(all_companies))
 
             # 3. E-Mail-Adressen extrahieren (falls gewünscht)
             if extract_emails:
@@ -169,7 +172,7 @@ class MainScraper:
                     1 for company in companies_with_emails if company.email
                 )
                 self.stats["emails_extracted"] = emails_found
-                self.logger.info(f"Extracted {emails_found} email addresses")
+                self.logger.info("Extracted %d email addresses", emails_found)
                 final_companies = companies_with_emails
             else:
                 final_companies = all_companies
@@ -185,7 +188,7 @@ class MainScraper:
             return final_stats
 
         except Exception as e:
-            self.logger.error(f"Error during complete scraping process: {e}")
+            self.logger.error("Error during complete scraping process: %s", e)
             self.stats["errors_encountered"] += 1
             raise
         finally:
@@ -204,7 +207,7 @@ class MainScraper:
             return True
 
         except Exception as e:
-            self.logger.error(f"Error navigating to search results: {e}")
+            self.logger.error("Error navigating to search results: %s", e)
             self.stats["errors_encountered"] += 1
             return False
 
@@ -216,76 +219,42 @@ class MainScraper:
 
         try:
             while current_page <= max_pages:
-                self.logger.info(f"Processing page {current_page}")
+                self.logger.info("Processing page %d", current_page)
 
-                # Alle Einträge auf der aktuellen Seite durchgehen (1-50)
-                for entry_index in range(1, 51):  # 1-50 Einträge pro Seite
-                    self.logger.info(
-                        f"Processing entry {entry_index} on page {current_page}"
-                    )
+                # Alle Detail-URLs einmalig auslesen - kein Zurück-Navigieren nötig
+                detail_urls = await self.navigator.get_result_urls()
+                if test_mode:
+                    detail_urls = detail_urls[: max(0, 5 - len(all_companies))]
 
-                    # Auf das n-te Suchergebnis klicken
-                    if not await self.navigator.click_nth_result(entry_index):
-                        self.logger.warning(
-                            f"Failed to click on result {entry_index} - possibly no more results on this page"
-                        )
-                        break  # Keine weiteren Einträge auf dieser Seite
-
-                    # Warten, bis die Detailseite geladen ist
-                    try:
-                        await self.navigator.page.wait_for_load_state(
-                            "networkidle", timeout=30000
-                        )
-                        self.logger.info(
-                            "Detail page loaded, waiting for content to stabilize"
-                        )
-                        await asyncio.sleep(5)  # Wait for any dynamic content
-                    except Exception as e:
-                        self.logger.warning(f"Error waiting for page load: {e}")
-
-                    # Daten von der Detailseite extrahieren
-                    companies = (
-                        await self.data_extractor.extract_all_listings_from_page()
-                    )
+                # Detailseiten parallel über den Page-Pool verarbeiten
+                results = await self.navigator.scrape_detail_pages(
+                    detail_urls, self._extract_from_detail_page
+                )
 
+                page_companies = []
+                for entry_index, companies in enumerate(results, start=1):
                     if companies:
                         self.logger.info(
-                            f"Successfully extracted data from detail page (entry {entry_index})"
+                            "Successfully extracted data from detail page (entry %d)",
+                            entry_index,
                         )
-                        all_companies.extend(companies)
-
-                        # Direkt in CSV speichern
-                        await self._export_results(companies)
+                        page_companies.extend(companies)
                     else:
                         self.logger.warning(
-                            f"No data could be extracted from detail page (entry {entry_index})"
+                            "No data could be extracted from detail page (entry %d)",
+                            entry_index,
                         )
 
-                    # Zurück zur Suchergebnisseite
-                    await self.navigator.return_to_search_results()
-                    self.logger.info("Returned to search results page")
-                    # Warten bis die Suchergebnisseite wieder geladen ist
-                    try:
-                        await self.navigator.page.wait_for_load_state(
-                            "networkidle", timeout=30000
-                        )
-                        self.logger.info("Search results page loaded")
-                        await asyncio.sleep(
-                            5
-                        )  # Reduziert von 30s auf 5s für bessere Performance
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Error waiting for search results page load: {e}"
-                        )
+                if page_companies:
+                    all_companies.extend(page_companies)
 
-                    # Test-Modus: Stoppe nach 5 Firmen
-                    if test_mode and len(all_companies) >= 5:
-                        self.logger.info("Test mode: Stopping after 5 companies")
-                        return all_companies
+                    # Direkt in CSV speichern
+                    await self._export_results(page_companies)
 
-                    # Kleine Verzögerung zwischen den Einträgen
-                    delay = random.uniform(1, 3)  # 1-3 Sekunden zwischen Einträgen
-                    await asyncio.sleep(delay)
+                # Test-Modus: Stoppe nach 5 Firmen
+                if test_mode and len(all_companies) >= 5:
+                    self.logger.info("Test mode: Stopping after 5 companies")
+                    return all_companies
 
                 # Nach allen Einträgen der Seite: Zur nächsten Seite navigieren
                 has_next = await self.pagination_handler.go_to_next_page()
@@ -306,17 +275,28 @@ class MainScraper:
             return all_companies
 
         except Exception as e:
-            self.logger.error(f"Error while scraping pages: {e}")
+            self.logger.error("Error while scraping pages: %s", e)
             self.stats["errors_encountered"] += 1
             return all_companies  # Return what we have so far
 
+    async def _extract_from_detail_page(self, page: Page) -> List[CompanyData]:
+        """Extrahiert die Firmendaten einer geladenen Detailseite"""
+        extractor = DataExtractor(page, self.config)
+        companies = await extractor.extract_all_listings_from_page()
+
+        # Kleine Verzögerung zwischen den Einträgen
+        delay = random.uniform(1, 3)  # 1-3 Sekunden zwischen Einträgen
+        await asyncio.sleep(delay)
+
+        return companies
+
     async def _extract_all_emails(
         self, companies: List[CompanyData]
     ) -> List[CompanyData]:
         """Extrahiert E-Mail-Adressen für alle Firmen"""
         try:
             self.logger.info(
-                f"Starting email extraction for {len(companies)} companies..."
+                "Starting email extraction for %d companies...", len(companies)
             )
 
             companies_with_emails = await self.email_extractor.extract_emails_bulk(
@@ -327,13 +307,16 @@ class MainScraper:
             success_rate = (emails_found / len(companies)) * 100 if companies else 0
 
             self.logger.info(
-                f"Email extraction completed: {emails_found}/{len(companies)} emails found ({success_rate:.1f}%)"
+                "Email extraction completed: %d/%d emails found (%.1f%%)",
+                emails_found,
+                len(companies),
+                success_rate,
             )
 
             return companies_with_emails
 
         except Exception as e:
-            self.logger.error(f"Error during email extraction: {e}")
+            self.logger.error("Error during email extraction: %s", e)
             self.stats["errors_encountered"] += 1
             return companies
 
@@ -349,11 +332,11 @@ class MainScraper:
                 # Füge die neuen Daten zur bestehenden Datei hinzu
                 await self.csv_exporter.append_companies(companies, self.output_file)
 
-            self.logger.info(f"Results exported to: {self.output_file}")
+            self.logger.info("Results exported to: %s", self.output_file)
             return self.output_file
 
         except Exception as e:
-            self.logger.error(f"Error exporting results: {e}")
+            self.logger.error("Error exporting results: %s", e)
             self.stats["errors_encountered"] += 1
             return ""
 
@@ -365,31 +348,37 @@ class MainScraper:
             self.logger.info("=" * 60)
             self.logger.info("SCRAPING COMPLETED - FINAL STATISTICS")
             self.logger.info("=" * 60)
-            self.logger.info(f"Duration: {duration}")
-            self.logger.info(f"Pages processed: {self.stats['pages_processed']}")
-            self.logger.info(f"Companies found: {self.stats['companies_found']}")
-            self.logger.info(f"Emails extracted: {self.stats['emails_extracted']}")
-            self.logger.info(
-                f"Success rate: {(self.stats['emails_extracted'] / self.stats['companies_found'] * 100) if self.stats['companies_found'] > 0 else 0:.1f}%"
+            self.logger.info("Duration: %s", duration)
+            self.logger.info("Pages processed: %d", self.stats["pages_processed"])
+            self.logger.info("Companies found: %d", self.stats["companies_found"])
+            self.logger.info("Emails extracted: %d", self.stats["emails_extracted"])
+            success_rate = (
+                self.stats["emails_extracted"] / self.stats["companies_found"] * 100
+                if self.stats["companies_found"] > 0
+                else 0
             )
-            self.logger.info(f"Errors encountered: {self.stats['errors_encountered']}")
+            self.logger.info("Success rate: %.1f%%", success_rate)
+            self.logger.info("Errors encountered: %d", self.stats["errors_encountered"])
             self.logger.info("=" * 60)
 
         except Exception as e:
-            self.logger.error(f"Error logging final statistics: {e}")
+            self.logger.error("Error logging final statistics: %s", e)
 
     async def cleanup(self):
         """Räumt Ressourcen auf"""
         try:
             self.logger.info("Cleaning up resources...")
 
+            if self.navigator:
+                await self.navigator.close_page_pool()
+
             if self.browser_manager:
                 await self.browser_manager.cleanup()
 
             self.logger.info("Cleanup completed")
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
 
     # Utility Methods
 
@@ -401,7 +390,7 @@ class MainScraper:
             await self.cleanup()
             return search_url is not None
         except Exception as e:
-            self.logger.error(f"Navigation test failed: {e}")
+            self.logger.error("Navigation test failed: %s", e)
             return False
 
     async def test_data_extraction(self, max_companies: int = 5) -> List[CompanyData]:
@@ -416,7 +405,7 @@ class MainScraper:
             await self.cleanup()
             return limited_companies
         except Exception as e:
-            self.logger.error(f"Data extraction test failed: {e}")
+            self.logger.error("Data extraction test failed: %s", e)
             return []
 
     async def test_email_extraction(self, company_data: CompanyData) -> CompanyData:
@@ -431,7 +420,7 @@ class MainScraper:
             await self.cleanup()
             return updated_company
         except Exception as e:
-            self.logger.error(f"Email extraction test failed: {e}")
+            self.logger.error("Email extraction test failed: %s", e)
             return company_data
 
     def get_statistics(self) -> Dict[str, Any]:
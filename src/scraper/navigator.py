@@ -5,13 +5,125 @@ Verwaltet die Navigation und Suche auf der 11880.com Website
 
 import asyncio
 import random
-from typing import Optional, Dict, Any, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import urljoin, urlparse, quote
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import (
+    Error as PlaywrightError,
+    Locator,
+    Page,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from ..utils.logging_config import get_logger
 
+T = TypeVar("T")
+
+# Standardanzahl parallel genutzter Seiten für Detailseiten
+MAX_PARALLEL_PAGES: Final = 3
+
+# Startseite der Suchergebnisse
+DEFAULT_SEARCH_URL: Final = "https://www.11880.com/suche/hausverwaltung/duesseldorf"
+
+# Selektoren für die Suchergebnisse
+RESULT_SELECTORS: Final[Tuple[str, ...]] = (
+    "div.result-list-entry__container",  # New primary selector
+    "div.result-list-entry-wrapper",  # Alternative wrapper
+    "article[data-entry-id]",  # Legacy selector
+    ".search-entry",  # Backup selector
+    ".business-entry",  # Another backup
+)
+JOINED_RESULTS: Final = ", ".join(RESULT_SELECTORS)
+RESULT_CONTAINER_SELECTOR: Final = ".result-list-entry__container"
+
+# Titel-Links innerhalb eines Suchergebnisses
+TITLE_SELECTORS: Final[Tuple[str, ...]] = (
+    "a.result-list-entry-title",  # New primary selector
+    "a.entry-detail-link",  # Alternative link class
+    "h2 a",  # Generic heading link
+    'a[title*="in"]',  # Link with location in title
+)
+TITLE_LINK_SELECTOR: Final = "a.result-list-entry-title.entry-detail-link"
+
+# Klickbare Container als Fallback
+CLICKABLE_SELECTORS: Final[Tuple[str, ...]] = (
+    "div.result-list-entry__container",
+    "div.result-list-entry-wrapper",
+    '[class*="result-list-entry"]',
+)
+JOINED_CLICKABLE: Final = ", ".join(CLICKABLE_SELECTORS)
+
+# Ressourcen, die für das Auslesen von DOM und Text nicht benötigt werden
+BLOCKED_RESOURCE_TYPES: Final = frozenset(
+    {"image", "font", "media", "stylesheet", "websocket", "other"}
+)
+
+# Einträge für get_current_page_info
+PAGE_INFO_SELECTORS: Final[Tuple[str, ...]] = (
+    "article[data-entry-id]",
+    ".search-entry",
+    ".business-entry",
+    '[data-testid="search-result-item"]',
+    ".entry-card",
+)
+JOINED_PAGE_INFO: Final = ", ".join(PAGE_INFO_SELECTORS)
+
+# Wartet per MutationObserver auf einen Selektor statt in festen Intervallen zu pollen
+# und liefert die Anzahl der Treffer (0 nach Timeout)
+FAST_WAIT_JS: Final = """([selector, timeout]) => new Promise((resolve) => {
+    const count = () => document.querySelectorAll(selector).length;
+    if (document.querySelector(selector)) return resolve(count());
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(count());
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(0);
+    }, timeout);
+    observer.observe(document.documentElement, { childList: true, subtree: true });
+})"""
+
+# Wartet auf die Titel-Links und liefert den href des n-ten Eintrags
+NTH_RESULT_HREF_JS: Final = (
+    """async ([selector, index, timeout]) => {
+    await (%s)([selector, timeout]);
+    const links = document.querySelectorAll(selector);
+    const link = index >= 1 ? links[index - 1] : undefined;
+    return { href: link ? link.getAttribute("href") : null, count: links.length };
+}"""
+    % FAST_WAIT_JS
+)
+
+# Cookie-Banner-Buttons
+COOKIE_SELECTORS: Final[Tuple[str, ...]] = (
+    "#cmpwelcomebtnyes",
+    ".cmpboxbtnyes",
+    "[aria-label='Alle akzeptieren']",
+    "#onetrust-accept-btn-handler",
+)
+JOINED_COOKIE: Final = ", ".join(COOKIE_SELECTORS)
+
+
+def _write_text_file(path: str, content: str) -> None:
+    """Schreibt Text in eine Datei (wird im Thread-Pool ausgeführt)"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
 
 class NavigationError(Exception):
     """Custom Exception für Navigation-Fehler"""
@@ -25,23 +137,54 @@ class Navigator:
     Implementiert robuste Suchfunktionalität für Hausverwaltungen
     """
 
-    def __init__(self, page: Page, config: Dict[str, Any]):
+    BASE = "https://www.11880.com"
+
+    def __init__(
+        self,
+        page: Page,
+        config: Dict[str, Any],
+        page_factory: Optional[Callable[[], Awaitable[Page]]] = None,
+    ):
         self.page = page
         self.config = config
+        # Liefert zusätzliche Seiten für den Page-Pool (Standard: selber Context)
+        self.page_factory = page_factory or page.context.new_page
         self.logger = get_logger(__name__)
         self.last_search_url = None  # Speichert die letzte Suchergebnisseite
+        # Cookies bleiben im Browser-Context erhalten - einmal akzeptieren genügt
+        self._cookies_accepted = asyncio.Event()
+        self._resource_blocking_installed = False
 
         # 11880.com spezifische URLs und Parameter
-        self.base_url = "https://www.11880.com/suche/hausverwaltung/duesseldorf"
+        self.base_url = DEFAULT_SEARCH_URL
         self.search_term = self.config.get("target", {}).get(
             "search_term", "Hausverwaltungen"
         )
         self.location = self.config.get("target", {}).get("location", "Düsseldorf")
+        self._search_tpl = self.BASE + "/suche/{}/{}"
+        self._search_tpl_term_only = self.BASE + "/suche/{}"
 
         # Retry-Konfiguration
         self.max_retries = self.config.get("scraping", {}).get("retry_attempts", 3)
         self.retry_delay = self.config.get("scraping", {}).get("retry_delay", 10)
 
+        # Debug-Konfiguration
+        self.save_failures = self.config.get("debug", {}).get("save_failures", False)
+
+        # Page-Pool für parallele Detailseiten
+        self.max_parallel_pages = self.config.get("scraping", {}).get(
+            "concurrent_requests", MAX_PARALLEL_PAGES
+        )
+        self._page_pool: Optional["asyncio.Queue[Page]"] = None
+        self._pool_pages: List[Page] = []
+        self._detail_urls: List[str] = []
+
+        # Locators einmalig anlegen - Playwright wertet sie erst bei Verwendung aus
+        self._joined_results_locator = page.locator(JOINED_RESULTS)
+        self._result_container_locator = page.locator(RESULT_CONTAINER_SELECTOR)
+        self._title_link_locator = page.locator(TITLE_LINK_SELECTOR)
+        self._cookie_locator = page.locator(JOINED_COOKIE)
+
     async def start_scraping(self) -> bool:
         """
         Startet den Scraping-Prozess direkt mit der Suchergebnisseite
@@ -50,59 +193,66 @@ class Navigator:
             bool: True wenn erfolgreich, False sonst
         """
         self.logger.info(
-            f"Starting scraping directly at search results: {self.base_url}"
+            "Starting scraping directly at search results: %s", self.base_url
         )
 
         return await self.navigate_to_search_url(self.base_url)
 
     async def navigate_to_search_url(self, search_url: str) -> bool:
         """Navigiert zu einer gegebenen Such-URL und wartet auf die Ergebnisse"""
+        await self._install_resource_blocking()
+
         for attempt in range(self.max_retries):
             try:
-                # Use domcontentloaded instead of networkidle for faster loading
-                # This allows us to start working with the page before all resources are loaded
+                # "commit" kehrt zurück sobald die Response-Header da sind -
+                # die Selektor-Waits danach ersetzen das Warten auf DOMContentLoaded
                 response = await self.page.goto(
-                    search_url, wait_until="domcontentloaded", timeout=15000
+                    search_url, wait_until="commit", timeout=15000
                 )
 
-                if not response or response.status >= 400:
-                    raise NavigationError(
-                        f"Page returned status {response.status if response else 'None'}"
-                    )
-
-                # Wait a bit for critical content to render, but don't wait for everything
-                await asyncio.sleep(3)
+                # None bei Same-Document-Navigation oder per Route abgefangenen Requests
+                if response is not None and not response.ok:
+                    raise NavigationError(f"Page returned status {response.status}")
 
+                # Cookie-Banner und Ergebnisse werden per Selektor abgewartet
                 await self.handle_cookie_consent()
 
                 # Try to find search results with a reasonable timeout
                 # Don't wait too long - the page might be usable even if not fully loaded
                 success = await self._wait_for_search_results()
                 if not success:
-                    # Try a second time with a shorter wait - sometimes content loads progressively
-                    await asyncio.sleep(2)
+                    # Try again once entries are attached - content loads progressively
+                    try:
+                        await self._joined_results_locator.first.wait_for(
+                            state="attached", timeout=2000
+                        )
+                    except PlaywrightTimeoutError:
+                        pass
                     success = await self._wait_for_search_results()
                     if not success:
                         raise NavigationError("Search results did not load")
 
-                self.logger.info(f"Successfully navigated to search URL: {search_url}")
+                self.logger.info("Successfully navigated to search URL: %s", search_url)
                 return True
 
-            except Exception as e:
+            except (PlaywrightError, NavigationError, asyncio.TimeoutError) as e:
                 self.logger.warning(
-                    f"Direct navigation attempt {attempt + 1} to {search_url} failed: {e}"
+                    "Direct navigation attempt %d to %s failed: %s",
+                    attempt + 1,
+                    search_url,
+                    e,
                 )
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(self.retry_delay * (attempt + 1))
 
-                    # Save debug info on last attempt
-                    if attempt == self.max_retries - 2:
+                    # Debug-Dumps nur wenn aktiviert (kosten Sekunden pro Retry)
+                    if self.save_failures:
                         try:
                             html = await self.page.content()
-                            with open(
-                                "page_on_timeout.html", "w", encoding="utf-8"
-                            ) as f:
-                                f.write(html)
+                            # Datei-I/O blockiert sonst den Event-Loop
+                            await asyncio.get_running_loop().run_in_executor(
+                                None, _write_text_file, "page_on_timeout.html", html
+                            )
                             self.logger.info(
                                 "Saved page content to page_on_timeout.html"
                             )
@@ -110,122 +260,119 @@ class Navigator:
                             await self.page.screenshot(path="page_on_timeout.png")
                             self.logger.info("Saved screenshot to page_on_timeout.png")
                         except Exception as debug_e:
-                            self.logger.error(f"Failed to save debug info: {debug_e}")
+                            self.logger.error("Failed to save debug info: %s", debug_e)
 
         self.logger.error(
-            f"Failed to navigate to search URL {search_url} after all attempts"
+            "Failed to navigate to search URL %s after all attempts", search_url
         )
         return False
 
+    async def _install_resource_blocking(self) -> None:
+        """Blockiert Bilder, Fonts, Medien und CSS einmalig für die Seite"""
+        if self._resource_blocking_installed:
+            return
+
+        await self.page.route("**/*", self._block_resources)
+        self._resource_blocking_installed = True
+
+    @staticmethod
+    async def _block_resources(route: Route) -> None:
+        """Route-Handler: bricht nicht benötigte Ressourcen ab"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort("blockedbyclient")
+        else:
+            # Weiter an die Context-Routen (URL-Blockliste des BrowserManagers)
+            await route.fallback()
+
     async def handle_cookie_consent(self) -> None:
         """Akzeptiert den Cookie-Banner, falls vorhanden"""
+        if self._cookies_accepted.is_set():
+            return
+
         try:
-            # Warte kurz, damit der Cookie-Banner erscheinen kann
-            await asyncio.sleep(2)
-
-            # Versuche verschiedene Cookie-Banner-Selektoren
-            cookie_selectors = [
-                "#cmpwelcomebtnyes",
-                ".cmpboxbtnyes",
-                "[aria-label='Alle akzeptieren']",
-                "#onetrust-accept-btn-handler",
-            ]
-
-            for selector in cookie_selectors:
-                try:
-                    await self.page.click(selector, timeout=5000)
-                    self.logger.info("Accepted cookie consent")
-                    await asyncio.sleep(5)  # Warte nach dem Klicken
-                    return
-                except PlaywrightTimeoutError:
-                    continue
+            # Ein Locator für alle Banner-Varianten - ein gemeinsames Timeout
+            try:
+                await self._cookie_locator.first.click(timeout=5000)
+            except PlaywrightTimeoutError:
+                return
+
+            self.logger.info("Accepted cookie consent")
+            self._cookies_accepted.set()
+
+            # Warte bis die Ergebnisliste nach dem Klicken wieder bereit ist
+            try:
+                await self._result_container_locator.first.wait_for(timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
 
         except Exception as e:
-            self.logger.warning(f"Could not handle cookie consent: {str(e)}")
+            self.logger.warning("Could not handle cookie consent: %s", e)
+
+    async def _fast_wait(self, selector: str, timeout_ms: int) -> int:
+        """
+        Wartet im Browser per MutationObserver auf einen Selektor
+
+        Returns:
+            int: Anzahl der Treffer sobald der Selektor existiert, 0 nach Timeout
+        """
+        return await self.page.evaluate(FAST_WAIT_JS, [selector, timeout_ms])
+
+    async def _first_present(
+        self, parent: Locator, selectors: Tuple[str, ...]
+    ) -> Optional[str]:
+        """Prüft alle Selektoren parallel und gibt den ersten vorhandenen zurück"""
+        counts = await asyncio.gather(
+            *(parent.locator(selector).count() for selector in selectors)
+        )
+        for selector, count in zip(selectors, counts):
+            if count:
+                return selector
+        return None
 
     async def _wait_for_search_results(self) -> bool:
         """Wartet, bis die Suchergebnisliste geladen ist und klickt auf das erste Ergebnis."""
         self.logger.info("Waiting for search results to load...")
         try:
-            # Updated selectors for search results based on the new HTML structure
-            result_selectors = [
-                "div.result-list-entry__container",  # New primary selector
-                "div.result-list-entry-wrapper",  # Alternative wrapper
-                "article[data-entry-id]",  # Legacy selector
-                ".search-entry",  # Backup selector
-                ".business-entry",  # Another backup
-            ]
-
-            # Try each selector with a reasonable timeout - don't wait too long
-            found_selector = None
-            for selector in result_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=10000)
-                    found_selector = selector
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not found_selector:
+            # Ein zusammengesetzter Selektor statt einer Abfrage pro Variante;
+            # Warten und Zählen erfolgen im selben Browser-Aufruf
+            num_entries = await self._fast_wait(JOINED_RESULTS, 10000)
+            if not num_entries:
                 self.logger.warning("No search results found with any selector")
                 return False
 
-            # Get all entries with the working selector
-            entries = await self.page.query_selector_all(found_selector)
-            if not entries:
-                self.logger.warning("No search results found on the page.")
-                return False
-
-            self.logger.info(f"Found {len(entries)} search results.")
+            self.logger.info("Found %d search results.", num_entries)
 
             # Try to click the first result's title link
-            first_result = entries[0]
+            first_result = self._joined_results_locator.first
             click_successful = False
 
             # Try clicking the title link first (new selector chain)
             try:
-                title_selectors = [
-                    "a.result-list-entry-title",  # New primary selector
-                    "a.entry-detail-link",  # Alternative link class
-                    "h2 a",  # Generic heading link
-                    'a[title*="in"]',  # Link with location in title
-                ]
-
-                for selector in title_selectors:
-                    title_link = await first_result.query_selector(selector)
-                    if title_link:
-                        await title_link.click()
-                        click_successful = True
-                        self.logger.info(
-                            f"Clicked on the first result's title link using selector: {selector}"
-                        )
-                        break
+                selector = await self._first_present(first_result, TITLE_SELECTORS)
+                if selector is not None:
+                    # Locator-Klick wartet und klickt atomar (kein veraltetes Handle)
+                    await first_result.locator(selector).first.click(timeout=5000)
+                    click_successful = True
+                    self.logger.info(
+                        "Clicked on the first result's title link using selector: %s",
+                        selector,
+                    )
 
             except Exception as e:
-                self.logger.warning(f"Failed to click title link: {e}")
+                self.logger.warning("Failed to click title link: %s", e)
 
             # If title click failed, try clicking the entire container
             if not click_successful:
                 try:
                     # Try to find a clickable parent element
-                    clickable_selectors = [
-                        "div.result-list-entry__container",
-                        "div.result-list-entry-wrapper",
-                        '[class*="result-list-entry"]',
-                    ]
-
-                    for selector in clickable_selectors:
-                        clickable = await first_result.query_selector(selector)
-                        if clickable:
-                            await clickable.click()
-                            click_successful = True
-                            self.logger.info(
-                                f"Clicked on the container using selector: {selector}"
-                            )
-                            break
+                    await first_result.locator(JOINED_CLICKABLE).first.click(
+                        timeout=5000
+                    )
+                    click_successful = True
+                    self.logger.info("Clicked on the container")
 
                 except Exception as e:
-                    self.logger.error(f"Failed to click container: {e}")
+                    self.logger.error("Failed to click container: %s", e)
 
             if not click_successful:
                 self.logger.error("Could not click on any element of the first result")
@@ -248,53 +395,110 @@ class Navigator:
                 self.logger.error("Timeout waiting for detail page to load")
                 return False
 
-        except Exception as e:
-            self.logger.error(f"Error in _wait_for_search_results: {e}")
+        except (PlaywrightError, NavigationError, asyncio.TimeoutError) as e:
+            self.logger.error("Error in _wait_for_search_results: %s", e)
             return False
 
     async def get_current_page_info(self) -> Dict[str, Any]:
         """Sammelt Informationen über die aktuelle Seite"""
         try:
-            # Try multiple selectors to find entries
-            selectors = [
-                "article[data-entry-id]",
-                ".search-entry",
-                ".business-entry",
-                '[data-testid="search-result-item"]',
-                ".entry-card",
-            ]
-
-            total_entries = 0
-            for selector in selectors:
-                entries = await self.page.query_selector_all(selector)
-                if entries:
-                    total_entries = len(entries)
-                    break
+            # Ein DOM-Durchlauf über alle Selektoren statt einer Abfrage pro Selektor
+            total_entries = await self.page.evaluate(
+                "sel => document.querySelectorAll(sel).length", JOINED_PAGE_INFO
+            )
 
             return {
                 "is_search_results_page": total_entries > 0,
                 "num_results": total_entries,
             }
         except Exception as e:
-            self.logger.error(f"Error getting page info: {e}")
+            self.logger.error("Error getting page info: %s", e)
             return {"is_search_results_page": False, "num_results": 0}
 
     async def navigate_to_url(self, url: str) -> None:
         """Navigiert zu einer bestimmten URL"""
+        await self._install_resource_blocking()
+
         try:
             await self.page.goto(url, timeout=120000)  # 120 Sekunden Timeout
-            self.logger.info(f"Successfully navigated to {url}")
+            self.logger.info("Successfully navigated to %s", url)
             await asyncio.sleep(5)  # Warte nach der Navigation
         except PlaywrightTimeoutError:
-            self.logger.error(f"Timeout while navigating to {url}")
+            self.logger.error("Timeout while navigating to %s", url)
             raise NavigationError(f"Could not navigate to {url}")
 
+    async def get_result_urls(self) -> List[str]:
+        """
+        Liest alle Detail-URLs der aktuellen Suchergebnisseite in einem Aufruf
+
+        Returns:
+            List[str]: Absolute URLs der Detailseiten in Trefferreihenfolge
+        """
+        # Nach start_scraping steht die Seite bereits auf dem ersten Treffer
+        if "/branchenbuch/" in self.page.url and ".html" in self.page.url:
+            await self.return_to_search_results()
+
+        if not await self._fast_wait(TITLE_LINK_SELECTOR, 30000):
+            self.logger.error("Timeout while waiting for search results")
+            self._detail_urls = []
+            return []
+
+        self.last_search_url = self.page.url
+        self._detail_urls = await self._collect_result_urls(self.page)
+        self.logger.info("Found %d detail page URLs", len(self._detail_urls))
+        return self._detail_urls
+
+    @staticmethod
+    async def _collect_result_urls(page: Page) -> List[str]:
+        """Liest die hrefs aller Titel-Links einer Suchergebnisseite"""
+        urls = await page.evaluate(
+            "sel => Array.from(document.querySelectorAll(sel)).map(a => a.href)",
+            TITLE_LINK_SELECTOR,
+        )
+        return [url for url in urls if url]
+
+    async def get_nth_result_url(self, index: int) -> Optional[str]:
+        """
+        Liest die URL des n-ten Suchergebnisses (1-basiert), ohne zu navigieren
+
+        Returns:
+            Optional[str]: Absolute URL der Detailseite oder None
+        """
+        # Warten und href-Auslesen in einem einzigen Browser-Aufruf
+        result = await self.page.evaluate(
+            NTH_RESULT_HREF_JS, [TITLE_LINK_SELECTOR, index, 30000]
+        )
+        links_count = result["count"]
+
+        if not links_count:
+            self.logger.error("Timeout while waiting for search results")
+            return None
+
+        # Prüfe ob der gewünschte Index existiert
+        if index < 1 or index > links_count:
+            self.logger.warning(
+                "Result index %d out of range (1-%d)", index, links_count
+            )
+            return None
+
+        href = result["href"]
+        if not href:
+            self.logger.error("Could not find detail page link for result %d", index)
+            return None
+
+        # 11880.com liefert meist bereits absolute oder root-relative Links
+        if href.startswith("http"):
+            return href
+        if href.startswith("/"):
+            return self.BASE + href
+        return urljoin(self.BASE, href)
+
     async def click_nth_result(self, index: int) -> bool:
         """Klickt auf das n-te Suchergebnis (1-basiert)"""
         try:
             # Speichere die aktuelle URL als Suchergebnisseite
             self.last_search_url = self.page.url
-            self.logger.info(f"Saved search results URL: {self.last_search_url}")
+            self.logger.info("Saved search results URL: %s", self.last_search_url)
 
             # Wenn wir bereits auf einer Detailseite sind, war die Navigation erfolgreich
             if (
@@ -304,12 +508,9 @@ class Navigator:
                 self.logger.info("Already on detail page")
                 return True
 
-            # Warte auf die Suchergebnisse
-            try:
-                await self.page.wait_for_selector(
-                    ".result-list-entry__container", timeout=30000
-                )
-            except PlaywrightTimeoutError:
+            # Warten und Zählen der Titel-Links in einem Browser-Aufruf
+            links_count = await self._fast_wait(TITLE_LINK_SELECTOR, 30000)
+            if not links_count:
                 # Wenn wir auf einer Detailseite sind, ist das kein Fehler
                 if "/branchenbuch/" in self.page.url and ".html" in self.page.url:
                     self.logger.info("Successfully navigated to detail page")
@@ -317,38 +518,19 @@ class Navigator:
                 self.logger.error("Timeout while waiting for search results")
                 return False
 
-            # Versuche alle Titel-Links zu finden
-            link_selector = "a.result-list-entry-title.entry-detail-link"
-            await self.page.wait_for_selector(link_selector, timeout=10000)
-
-            # Hole alle Links
-            links = await self.page.evaluate(
-                f"""Array.from(document.querySelectorAll('{link_selector}')).map(link => link.getAttribute('href'))"""
-            )
-
-            if not links:
-                self.logger.error("No search result links found")
-                return False
-
-            # Prüfe ob der gewünschte Index existiert
-            if index < 1 or index > len(links):
-                self.logger.warning(f"Result index {index} out of range (1-{len(links)})")
+            if index < 1 or index > links_count:
+                self.logger.warning(
+                    "Result index %d out of range (1-%d)", index, links_count
+                )
                 return False
 
-            # Hole den href-Wert des gewünschten Links (index-1 wegen 0-basiertem Array)
-            href = links[index - 1]
-            if href:
-                # Konstruiere die vollständige URL
-                base_url = "https://www.11880.com"
-                full_url = urljoin(base_url, href)
-
-                # Navigiere zur Detail-Seite
-                await self.navigate_to_url(full_url)
-                self.logger.info(f"Successfully navigated to detail page for result {index}")
-                return True
-
-            self.logger.error(f"Could not find detail page link for result {index}")
-            return False
+            # Locator-Klick mit Auto-Wait statt href auslesen und goto
+            await self._title_link_locator.nth(index - 1).click(timeout=10000)
+            await self.page.wait_for_load_state("domcontentloaded", timeout=30000)
+            self.logger.info(
+                "Successfully navigated to detail page for result %d", index
+            )
+            return True
 
         except PlaywrightTimeoutError:
             # Wenn wir auf einer Detailseite sind, ist das kein Fehler
@@ -358,9 +540,153 @@ class Navigator:
             self.logger.error("Timeout while waiting for search results")
             return False
         except Exception as e:
-            self.logger.error(f"Error clicking on result {index}: {str(e)}")
+            self.logger.error("Error clicking on result %d: %s", index, e)
             return False
 
+    async def scrape_detail_page(self, url: str, page: Page) -> bool:
+        """
+        Lädt eine Detailseite in einer Seite aus dem Page-Pool
+
+        Args:
+            url: URL der Detailseite
+            page: Seite, in der die Detailseite geöffnet wird
+
+        Returns:
+            bool: True wenn die Detailseite geladen wurde
+        """
+        try:
+            response = await page.goto(
+                url, wait_until="domcontentloaded", timeout=30000
+            )
+            if response is not None and not response.ok:
+                self.logger.warning(
+                    "Detail page %s returned status %s", url, response.status
+                )
+                return False
+            return True
+        except PlaywrightTimeoutError:
+            self.logger.error("Timeout while loading detail page %s", url)
+            return False
+        except PlaywrightError as e:
+            # z.B. net::ERR_* - nur diese Detailseite überspringen
+            self.logger.error("Error loading detail page %s: %s", url, e)
+            return False
+
+    async def scrape_detail_pages(
+        self, urls: List[str], scrape: Callable[[Page], Awaitable[T]]
+    ) -> List[Optional[T]]:
+        """
+        Verarbeitet mehrere Detailseiten parallel über einen Page-Pool
+
+        Args:
+            urls: URLs der Detailseiten
+            scrape: Callback, der die geladene Seite auswertet
+
+        Returns:
+            List[Optional[T]]: Ergebnis pro URL (None wenn das Laden fehlschlug)
+        """
+        pool = await self._get_page_pool()
+
+        async def process(url: str) -> Optional[T]:
+            # Der Pool begrenzt die Anzahl gleichzeitig geöffneter Seiten
+            page = await pool.get()
+            try:
+                if not await self.scrape_detail_page(url, page):
+                    return None
+                return await scrape(page)
+            except PlaywrightError as e:
+                self.logger.error("Error scraping detail page %s: %s", url, e)
+                return None
+            finally:
+                pool.put_nowait(page)
+
+        return await asyncio.gather(*(process(url) for url in urls))
+
+    async def scrape_all(
+        self, urls: List[str], scrape: Callable[[Page], Awaitable[T]]
+    ) -> List[Optional[T]]:
+        """
+        Verarbeitet Detailseiten nacheinander und lädt die nächste im Hintergrund
+
+        Während Seite k ausgewertet wird, läuft das goto für Seite k+1 bereits in
+        einer zweiten Seite aus dem Page-Pool. Ist keine Seite frei, wird die
+        nächste Detailseite erst nach der Auswertung geladen.
+
+        Args:
+            urls: URLs der Detailseiten
+            scrape: Callback, der die geladene Seite auswertet
+
+        Returns:
+            List[Optional[T]]: Ergebnis pro URL (None wenn das Laden fehlschlug)
+        """
+        pool = await self._get_page_pool()
+        prefetch_tasks: Dict[int, "asyncio.Future[bool]"] = {}
+        prefetch_pages: Dict[int, Page] = {}
+        results: List[Optional[T]] = []
+
+        def start_load(index: int, page: Page) -> None:
+            prefetch_pages[index] = page
+            prefetch_tasks[index] = asyncio.ensure_future(
+                self.scrape_detail_page(urls[index], page)
+            )
+
+        try:
+            for index in range(len(urls)):
+                if index not in prefetch_tasks:
+                    start_load(index, await pool.get())
+
+                # Nächste Detailseite vorladen, falls eine Seite frei ist
+                if index + 1 < len(urls):
+                    try:
+                        start_load(index + 1, pool.get_nowait())
+                    except asyncio.QueueEmpty:
+                        pass
+
+                page = prefetch_pages.pop(index)
+                try:
+                    loaded = await prefetch_tasks.pop(index)
+                    results.append(await scrape(page) if loaded else None)
+                except PlaywrightError as e:
+                    # Fehler betrifft nur diese URL, nicht den ganzen Durchlauf
+                    self.logger.error(
+                        "Error scraping detail page %s: %s", urls[index], e
+                    )
+                    results.append(None)
+                finally:
+                    pool.put_nowait(page)
+        finally:
+            # Nicht mehr benötigte Vorlade-Tasks abbrechen und deren Ende abwarten,
+            # bevor die Seiten zurück in den Pool gehen
+            for task in prefetch_tasks.values():
+                task.cancel()
+            await asyncio.gather(*prefetch_tasks.values(), return_exceptions=True)
+            for page in prefetch_pages.values():
+                pool.put_nowait(page)
+
+        return results
+
+    async def _get_page_pool(self) -> "asyncio.Queue[Page]":
+        """Erstellt den Page-Pool beim ersten Zugriff im selben Browser-Context"""
+        if self._page_pool is None:
+            pool: "asyncio.Queue[Page]" = asyncio.Queue()
+            for _ in range(self.max_parallel_pages):
+                page = await self.page_factory()
+                await page.route("**/*", self._block_resources)
+                self._pool_pages.append(page)
+                pool.put_nowait(page)
+            self._page_pool = pool
+        return self._page_pool
+
+    async def close_page_pool(self) -> None:
+        """Schließt alle Seiten des Page-Pools"""
+        for page in self._pool_pages:
+            try:
+                await page.close()
+            except Exception as e:
+                self.logger.warning("Could not close pooled page: %s", e)
+        self._pool_pages = []
+        self._page_pool = None
+
     async def click_first_result(self) -> bool:
         """Klickt auf das erste Suchergebnis - Wrapper für click_nth_result"""
         return await self.click_nth_result(1)
@@ -371,10 +697,12 @@ class Navigator:
             self.logger.info("Going back to search results using browser back button")
 
             # Verwende den Browser-Zurück-Button
-            await self.page.go_back(wait_until="domcontentloaded", timeout=15000)
+            await self.page.go_back(wait_until="commit", timeout=15000)
 
-            # Kurz warten, damit sich die Seite stabilisiert
-            await asyncio.sleep(2)
+            # Auf die Ergebnisliste warten statt auf DOMContentLoaded
+            await self._result_container_locator.first.wait_for(
+                state="attached", timeout=15000
+            )
 
             # Prüfe ob wir wieder auf der Suchergebnisseite sind
             # page_info = await self.get_current_page_info()
@@ -391,17 +719,17 @@ class Navigator:
             #     return False
 
         except Exception as e:
-            self.logger.error(f"Error going back to search results: {str(e)}")
+            self.logger.error("Error going back to search results: %s", e)
             # Fallback: Verwende die gespeicherte URL
             try:
                 if self.last_search_url:
                     self.logger.info(
-                        f"Fallback: Navigating to saved URL: {self.last_search_url}"
+                        "Fallback: Navigating to saved URL: %s", self.last_search_url
                     )
                     await self.navigate_to_url(self.last_search_url)
                     return True
             except Exception as fallback_error:
-                self.logger.error(f"Fallback navigation also failed: {fallback_error}")
+                self.logger.error("Fallback navigation also failed: %s", fallback_error)
             return False
 
     async def search_for_term(self, search_term: str, location: str = "") -> bool:
@@ -414,36 +742,29 @@ class Navigator:
         """
         try:
             # Baue die Such-URL
-            encoded_term = quote(search_term)
-            encoded_location = quote(location) if location else ""
-
             if location:
-                search_url = (
-                    f"https://www.11880.com/suche/{encoded_term}/{encoded_location}"
+                search_url = self._search_tpl.format(
+                    quote(search_term), quote(location)
                 )
             else:
-                search_url = f"https://www.11880.com/suche/{encoded_term}"
+                search_url = self._search_tpl_term_only.format(quote(search_term))
 
             # Navigiere zur Suchseite
             await self.navigate_to_url(search_url)
             self.last_search_url = search_url  # Speichere die Such-URL
 
             # Warte auf die Suchergebnisse
-            await self.page.wait_for_selector(
-                ".result-list-entry__container", timeout=30000
-            )
+            await self._result_container_locator.first.wait_for(timeout=30000)
 
             # Prüfe ob Ergebnisse gefunden wurden
-            results = await self.page.query_selector_all(
-                ".result-list-entry__container"
-            )
-            if not results:
+            num_results = await self._result_container_locator.count()
+            if not num_results:
                 self.logger.warning("No search results found")
                 return False
 
-            self.logger.info(f"Found {len(results)} search results")
+            self.logger.info("Found %d search results", num_results)
             return True
 
         except Exception as e:
-            self.logger.error(f"Error during search: {str(e)}")
+            self.logger.error("Error during search: %s", e)
             return False
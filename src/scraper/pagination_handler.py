@@ -6,14 +6,88 @@ Verwaltet das Durchlaufen aller Suchergebnisseiten
 import asyncio
 import random
 import re
-from typing import Optional, Dict, Any, List
-from urllib.parse import urljoin, urlparse, parse_qs
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, Final, List, Set, Tuple
+from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 
-from bs4 import BeautifulSoup
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
 
 from ..utils.logging_config import get_logger
 
+# Selektoren für "Nächste Seite" Links
+# (:contains wird von Lexbor nicht unterstützt - Textprüfung im Fallback)
+NEXT_SELECTORS: Final[Tuple[str, ...]] = (
+    'a[rel="next"]',
+    '[class*="next"] a',
+    '[class*="weiter"] a',
+)
+# Alle Varianten in einer Abfrage - nur Links mit href kommen in Frage
+JOINED_NEXT: Final = ", ".join(f"{selector}[href]" for selector in NEXT_SELECTORS)
+
+# Selektoren, deren Erscheinen eine geladene Ergebnisseite anzeigt
+RESULT_SELECTORS: Final[Tuple[str, ...]] = (
+    ".search-results",
+    ".result-list",
+    '[class*="result"]',
+    '[class*="listing"]',
+    "article",
+)
+JOINED_RESULTS: Final = ", ".join(RESULT_SELECTORS)
+RESULT_ELEMENTS_SELECTOR: Final = '[class*="result"], [class*="listing"], article'
+
+# Kandidaten für die Pattern-Suche: Seitenparameter im href oder Paginierungs-Container
+PAGINATION_LINK_SELECTOR: Final = ", ".join(
+    (
+        'a[href^="?"]',
+        'a[href*="page="]',
+        'a[href*="seite="]',
+        'a[href*="p="]',
+        'a[href*="offset="]',
+        ".pagination a[href]",
+        ".pager a[href]",
+        '[class*="pagination"] a[href]',
+    )
+)
+
+# Nur eindeutige Angaben der letzten Seite - normale Paginierungs-Links zeigen
+# bei 11880 oft nur auf die nächste Seite ("1 von 10" mit Link auf ?page=2)
+LAST_PAGE_SELECTOR: Final = 'a[rel="last"]'
+MAX_PAGE_SELECTOR: Final = ".numbertext--max"
+
+# Container der Paginierung
+PAGINATION_SELECTORS: Final[Tuple[str, ...]] = (
+    ".pagination",
+    ".pager",
+    ".page-nav",
+    '[class*="pagination"]',
+    '[class*="pager"]',
+)
+
+# Linktexte und Query-Parameter, die auf die nächste Seite hinweisen
+NEXT_KEYWORD_RE: Final = re.compile(r"weiter|nächste|next|>|▶|→", re.IGNORECASE)
+PAGE_PARAMS: Final[Tuple[str, ...]] = ("page", "seite", "p", "offset")
+# Parameter, über die sich eine Seitennummer direkt setzen lässt
+PAGE_NUMBER_PARAMS: Final[Tuple[str, ...]] = ("page", "seite", "p")
+PAGE_PARAM_RE: Final = re.compile(r"([?&](?:page|seite|p)=)(\d+)")
+
+# Hinweise in URL und Titel auf eine Suchergebnisseite
+URL_INDICATOR_RE: Final = re.compile(
+    r"suche|search|hausverwaltung|düsseldorf", re.IGNORECASE
+)
+TITLE_INDICATOR_RE: Final = re.compile(
+    r"hausverwaltung|düsseldorf|suche|ergebnis", re.IGNORECASE
+)
+
+# Gesamtanzahl der Ergebnisse, z.B. "123 Ergebnisse"
+RESULT_COUNT_SELECTOR: Final = (
+    '[class*="result-count"], [class*="results-info"], h1, h2, .search-header'
+)
+RESULT_COUNT_RE: Final = re.compile(
+    r"(\d+)\s*(Ergebnisse|Treffer|Einträge|results)", re.IGNORECASE
+)
+
 
 class PaginationHandler:
     """
@@ -38,7 +112,16 @@ class PaginationHandler:
         # State tracking
         self.current_page = 1
         self.total_pages = None
-        self.visited_urls = set()
+        # Hashes der kanonischen URLs statt der URL-Strings (siehe _canon)
+        self.visited_urls: Set[int] = set()
+        # Zeitpunkt der letzten erfolgreichen Navigation (time.monotonic)
+        self._last_nav_ts: Optional[float] = None
+
+        # Geparstes HTML der aktuellen Seite (wird bei Navigation verworfen)
+        self._cached_html: Optional[str] = None
+        self._cached_tree: Optional[LexborHTMLParser] = None
+        self._cached_url: Optional[str] = None
+        self._cached_title: Optional[str] = None
 
     async def go_to_next_page(self) -> bool:
         """
@@ -65,16 +148,19 @@ class PaginationHandler:
                 return False
 
             # Vermeide Duplikate
-            if next_page_url in self.visited_urls:
+            if self._canon(next_page_url) in self.visited_urls:
                 self.logger.warning(f"Already visited URL: {next_page_url}")
                 return False
 
+            # Pause zwischen Seiten - zählt ab der letzten Navigation
+            await self._wait_between_pages()
+
             # Navigiere zur nächsten Seite
             navigation_successful = await self._navigate_to_next_page(next_page_url)
 
             if navigation_successful:
                 # Markiere URL als besucht
-                self.visited_urls.add(next_page_url)
+                self.visited_urls.add(self._canon(next_page_url))
                 self.current_page += 1
 
                 self.logger.info(f"Successfully navigated to page {self.current_page}")
@@ -84,9 +170,6 @@ class PaginationHandler:
                     self.logger.warning("Navigation successful but not on search results page")
                     return False
 
-                # Pause zwischen Seiten
-                await self._wait_between_pages()
-
                 return True
             else:
                 self.logger.error("Failed to navigate to next page")
@@ -111,20 +194,35 @@ class PaginationHandler:
 
             # Erste Seite hinzufügen
             page_urls.append(current_url)
-            self.visited_urls.add(current_url)
+            self.visited_urls.add(self._canon(current_url))
 
             page_count = 1
 
-            while page_count < self.max_pages:
+            # Letzte Seitennummer einmal auslesen - dann Seiten-URLs direkt bilden
+            last_page = self._find_last_page_number(await self._get_tree())
+            page_limit = self.max_pages
+            if last_page:
+                self.total_pages = last_page
+                page_limit = min(self.max_pages, last_page)
+                self.logger.info(f"Pagination shows {last_page} pages")
+
+            first_url = current_url
+            while page_count < page_limit:
                 # Versuche zur nächsten Seite zu navigieren
-                next_url = await self._get_next_page_url()
+                if last_page:
+                    next_url = self._build_page_url(first_url, page_count + 1)
+                else:
+                    next_url = await self._get_next_page_url()
 
-                if not next_url or next_url in self.visited_urls:
+                if not next_url or self._canon(next_url) in self.visited_urls:
                     self.logger.info(
                         f"No more pages found. Total pages processed: {page_count}"
                     )
                     break
 
+                # Menschenähnliche Pause - zählt ab der letzten Navigation
+                await self._wait_between_pages()
+
                 # Zur nächsten Seite navigieren
                 success = await self._navigate_to_next_page(next_url)
 
@@ -135,15 +233,12 @@ class PaginationHandler:
                 page_count += 1
                 current_url = self.page.url
                 page_urls.append(current_url)
-                self.visited_urls.add(current_url)
+                self.visited_urls.add(self._canon(current_url))
 
                 self.logger.info(
                     f"Successfully navigated to page {page_count}: {current_url}"
                 )
 
-                # Menschenähnliche Pause zwischen Seiten
-                await self._wait_between_pages()
-
                 # Sicherheitscheck: Sind wir noch auf einer Suchergebnisseite?
                 if not await self._is_search_results_page():
                     self.logger.warning(
@@ -158,61 +253,240 @@ class PaginationHandler:
             self.logger.error(f"Error during pagination: {e}")
             return page_urls if "page_urls" in locals() else []
 
+    async def get_all_pages_parallel(self, max_parallel: int = 3) -> List[str]:
+        """
+        Ermittelt alle Seiten-URLs, indem Seitennummern parallel geladen werden
+
+        Seiten 2..N werden direkt über den Seitenparameter in eigenen Tabs
+        geöffnet. Ist die Seitenanzahl unbekannt, wird blockweise geprüft, bis
+        eine Seite leer ist oder der ersten gleicht. Lässt sich keine weitere
+        Seite so laden, obwohl ein "Weiter"-Link existiert, wird sequenziell
+        über get_all_pages paginiert.
+
+        Args:
+            max_parallel: Maximale Anzahl gleichzeitig geöffneter Tabs
+
+        Returns:
+            List[str]: Liste aller Seiten-URLs
+        """
+        first_url = self.page.url
+        page_urls = [first_url]
+        first_signature = await self._result_signature(self.page)
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def fetch(page_number: int) -> Optional[str]:
+            async with semaphore:
+                return await self._fetch_page_n(first_url, page_number, first_signature)
+
+        info = await self.get_pagination_info()
+        total_pages = info["total_pages"]
+
+        try:
+            if total_pages:
+                last_page = min(total_pages, self.max_pages)
+                results = await asyncio.gather(
+                    *(fetch(number) for number in range(2, last_page + 1))
+                )
+                page_urls.extend(url for url in results if url)
+            else:
+                # Seitenanzahl unbekannt - blockweise spekulativ laden
+                page_number = 2
+                while page_number <= self.max_pages:
+                    batch = range(
+                        page_number, min(page_number + max_parallel, self.max_pages + 1)
+                    )
+                    results = await asyncio.gather(*(fetch(number) for number in batch))
+
+                    found = []
+                    for url in results:
+                        if not url:
+                            break
+                        found.append(url)
+                    page_urls.extend(found)
+
+                    if len(found) < len(batch):
+                        break
+                    page_number += len(batch)
+
+        except Exception as e:
+            self.logger.error(f"Error during parallel pagination: {e}")
+
+        if len(page_urls) == 1 and info["has_next"]:
+            self.logger.info(
+                "Direct page URLs failed, falling back to sequential crawl"
+            )
+            return await self.get_all_pages()
+
+        self.logger.info(f"Parallel pagination completed. Found {len(page_urls)} pages")
+        return page_urls
+
+    async def _fetch_page_n(
+        self, base_url: str, page_number: int, first_signature: Optional[int]
+    ) -> Optional[str]:
+        """
+        Lädt eine Seitennummer in einem eigenen Tab
+
+        Returns:
+            Optional[str]: URL der Seite, None wenn sie leer ist oder der ersten gleicht
+        """
+        url = self._build_page_url(base_url, page_number)
+        page = await self.page.context.new_page()
+        try:
+            response = await page.goto(url, wait_until="domcontentloaded")
+            if not response or response.status >= 400:
+                return None
+
+            signature = await self._result_signature(page)
+            if signature is None or signature == first_signature:
+                return None
+
+            self.logger.debug(f"Found page {page_number}: {url}")
+            return url
+
+        except Exception as e:
+            self.logger.warning(f"Error loading page {page_number}: {e}")
+            return None
+        finally:
+            await page.close()
+
+    async def _result_signature(self, page: Page) -> Optional[int]:
+        """
+        Bildet einen Fingerabdruck der Suchergebnisse einer Seite
+
+        Ignoriert der Server den Seitenparameter, liefert er wieder Seite 1 -
+        das erkennt der Vergleich der Fingerabdrücke.
+        """
+        locator = page.locator(RESULT_ELEMENTS_SELECTOR)
+        try:
+            await locator.first.wait_for(state="attached", timeout=10000)
+        except PlaywrightTimeoutError:
+            return None
+        return hash("\n".join(await locator.all_inner_texts()))
+
+    @staticmethod
+    def _build_page_url(url: str, page_number: int) -> str:
+        """Setzt die Seitennummer im Query-String (Standard: page=N)"""
+        new_url = PaginationHandler._replace_page_number(url, page_number)
+        if new_url:
+            return new_url
+
+        parsed = urlparse(url)
+        page_query = f"page={page_number}"
+        query = f"{parsed.query}&{page_query}" if parsed.query else page_query
+        return parsed._replace(query=query).geturl()
+
+    @staticmethod
+    def _replace_page_number(url: str, page_number: int) -> Optional[str]:
+        """
+        Ersetzt die Seitennummer in einer URL
+
+        Returns:
+            Optional[str]: Neue URL, None wenn die URL keinen Seitenparameter hat
+        """
+        # Schneller Weg: nur die Zahl ersetzen, übrige Parameter bleiben unberührt
+        new_url, count = PAGE_PARAM_RE.subn(
+            lambda match: f"{match.group(1)}{page_number}", url, count=1
+        )
+        if count:
+            return new_url
+
+        # Fallback für nicht-numerische Werte
+        parsed = urlparse(url)
+        query_params = parse_qs(parsed.query)
+        for param in PAGE_NUMBER_PARAMS:
+            if param in query_params:
+                query_params[param] = [str(page_number)]
+                new_query = urlencode(query_params, doseq=True)
+                return f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{new_query}"
+        return None
+
+    @staticmethod
+    def _canon(url: str) -> int:
+        """Hash der URL ohne Fragment - für den Duplikat-Check in visited_urls"""
+        return hash(urlparse(url)._replace(fragment="").geturl())
+
+    async def _get_tree(self) -> LexborHTMLParser:
+        """
+        Liefert den geparsten DOM der aktuellen Seite
+
+        HTML wird nur einmal pro Seite aus dem Browser geholt und geparst.
+        Hat sich die URL seit dem letzten Abruf geändert, wird neu geladen.
+        """
+        html_content = await self._get_html()
+        if self._cached_tree is None:
+            self._cached_tree = LexborHTMLParser(html_content)
+        return self._cached_tree
+
+    async def _get_html(self) -> str:
+        """Liefert das HTML der aktuellen Seite - einmal pro Seite geholt"""
+        self._check_cached_url()
+        if self._cached_html is None:
+            self._cached_html = await self.page.content()
+        return self._cached_html
+
+    async def _get_title(self) -> str:
+        """Liefert den Seitentitel - einmal pro Seite aus dem Browser geholt"""
+        self._check_cached_url()
+        if self._cached_title is None:
+            self._cached_title = await self.page.title()
+        return self._cached_title
+
+    def _check_cached_url(self) -> None:
+        """Verwirft die Caches, wenn die Seite inzwischen eine andere URL hat"""
+        if self._cached_url != self.page.url:
+            self._invalidate_tree()
+            self._cached_url = self.page.url
+
+    def _invalidate_tree(self) -> None:
+        """Verwirft gecachten DOM und Titel nach einer Navigation"""
+        self._cached_html = None
+        self._cached_tree = None
+        self._cached_url = None
+        self._cached_title = None
+
     async def _get_next_page_url(self) -> Optional[str]:
         """Findet die URL der nächsten Seite"""
 
         try:
-            html_content = await self.page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Verschiedene Selektoren für "Nächste Seite" Links
-            next_selectors = [
-                'a[rel="next"]',
-                'a:contains("Weiter")',
-                'a:contains("Nächste")',
-                'a:contains("Next")',
-                'a:contains(">")',
-                '.pagination a:contains(">")',
-                '.pager a:contains(">")',
-                '[class*="next"] a',
-                '[class*="weiter"] a',
-            ]
+            tree = await self._get_tree()
 
-            for selector in next_selectors:
-                try:
-                    next_link = soup.select_one(selector)
-                    if next_link:
-                        href = next_link.get("href")
-                        if href:
-                            # Relative URLs zu absoluten konvertieren
-                            if href.startswith("/"):
-                                next_url = urljoin(self.base_url, href)
-                            else:
-                                next_url = href
-
-                            self.logger.debug(f"Found next page URL: {next_url}")
-                            return next_url
-                except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            # Alle "Nächste Seite" Selektoren in einem Durchlauf prüfen
+            next_link = tree.css_first(JOINED_NEXT)
+            if next_link:
+                href = next_link.attributes.get("href")
+                if href:
+                    # Relative URLs zu absoluten konvertieren
+                    next_url = self._normalize_href(self.base_url, href)
 
-            # Fallback: Suche nach Pagination-Pattern in Links
-            all_links = soup.select("a[href]")
+                    self.logger.debug(f"Found next page URL: {next_url}")
+                    return next_url
 
-            for link in all_links:
-                href = link.get("href", "")
-                text = link.get_text(strip=True)
+            # Fallback: Suche nach Pagination-Pattern - nur in paginierungsartigen
+            # Links statt in allen Links der Seite
+            candidates = [
+                (link.attributes.get("href") or "", link.text(strip=True))
+                for link in tree.css(PAGINATION_LINK_SELECTOR)
+            ]
 
+            for href, text in candidates:
                 # Pattern für Seitennummer (page+1)
                 if self._is_next_page_link(href, text):
-                    if href.startswith("/"):
-                        next_url = urljoin(self.base_url, href)
-                    else:
-                        next_url = href
+                    next_url = self._normalize_href(self.base_url, href)
 
                     self.logger.debug(f"Found next page via pattern: {next_url}")
                     return next_url
 
+            # Letzter Versuch: "Weiter"/"Nächste"-Links mit einfachem Pfad als href,
+            # die außerhalb der Paginierungs-Container stehen
+            for link in tree.css("a[href]"):
+                if NEXT_KEYWORD_RE.search(link.text(strip=True)):
+                    next_url = self._normalize_href(
+                        self.base_url, link.attributes.get("href") or ""
+                    )
+
+                    self.logger.debug(f"Found next page via link text: {next_url}")
+                    return next_url
+
             self.logger.debug("No next page URL found")
             return None
 
@@ -220,34 +494,92 @@ class PaginationHandler:
             self.logger.error(f"Error finding next page URL: {e}")
             return None
 
+    @staticmethod
+    def _find_last_page_number(tree: LexborHTMLParser) -> Optional[int]:
+        """
+        Liest die letzte Seitennummer aus einem rel="last"-Link oder der
+        expliziten Maximalangabe (.numbertext--max)
+
+        Returns:
+            Optional[int]: Letzte Seitennummer oder None wenn keine erkennbar ist -
+                dann wird über die "Weiter"-Links paginiert
+        """
+        link = tree.css_first(LAST_PAGE_SELECTOR)
+        if link is not None:
+            match = PAGE_PARAM_RE.search(link.attributes.get("href") or "")
+            if match:
+                return int(match.group(2))
+            text = link.text(strip=True)
+            if text.isdigit():
+                return int(text)
+
+        node = tree.css_first(MAX_PAGE_SELECTOR)
+        if node is not None:
+            match = re.search(r"\d+", node.text(strip=True))
+            if match:
+                return int(match.group())
+
+        return None
+
+    @staticmethod
+    def _find_result_count(tree: LexborHTMLParser) -> Optional[int]:
+        """
+        Sucht die Gesamtanzahl der Ergebnisse, z.B. "123 Ergebnisse"
+
+        Zuerst werden nur typische Überschriften und Zähler-Elemente geprüft,
+        der Text der ganzen Seite nur wenn dort nichts gefunden wird.
+        """
+        for node in tree.css(RESULT_COUNT_SELECTOR):
+            match = RESULT_COUNT_RE.search(node.text(separator=" "))
+            if match:
+                return int(match.group(1))
+
+        # Fallback: gesamter Seitentext
+        root = tree.body or tree
+        match = RESULT_COUNT_RE.search(root.text(deep=True, separator=" "))
+        return int(match.group(1)) if match else None
+
     def _is_next_page_link(self, href: str, text: str) -> bool:
         """Prüft ob ein Link zur nächsten Seite führt"""
 
         # Text-basierte Prüfung
-        next_keywords = ["weiter", "nächste", "next", ">", "▶", "→"]
-        if any(keyword in text.lower() for keyword in next_keywords):
+        if NEXT_KEYWORD_RE.search(text):
             return True
 
         # URL-basierte Prüfung für Seitennummer
-        try:
-            parsed = urlparse(href)
-            query_params = parse_qs(parsed.query)
-
-            # Häufige Parameter für Seitennummer
-            page_params = ["page", "seite", "p", "offset"]
-
-            for param in page_params:
-                if param in query_params:
-                    try:
-                        page_num = int(query_params[param][0])
-                        if page_num == self.current_page + 1:
-                            return True
-                    except (ValueError, IndexError):
-                        continue
-        except:
-            pass
+        return self.current_page + 1 in self._page_numbers(href)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_href(base: str, href: str) -> str:
+        """Konvertiert relative Links (/pfad) zu absoluten URLs"""
+        if href.startswith("/"):
+            return urljoin(base, href)
+        return href
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _page_numbers(href: str) -> Tuple[int, ...]:
+        """
+        Liest Seitennummern aus den Query-Parametern eines Links
 
-        return False
+        Links einer Ergebnisseite wiederholen sich stark, daher wird das
+        Ergebnis pro href zwischengespeichert.
+        """
+        try:
+            query_params = parse_qs(urlparse(href).query)
+        except ValueError:
+            return ()
+
+        # Häufige Parameter für Seitennummer
+        numbers = []
+        for param in PAGE_PARAMS:
+            if param in query_params:
+                try:
+                    numbers.append(int(query_params[param][0]))
+                except (ValueError, IndexError):
+                    continue
+        return tuple(numbers)
 
     async def _navigate_to_next_page(self, next_url: str) -> bool:
         """Navigiert zur nächsten Seite"""
@@ -255,11 +587,35 @@ class PaginationHandler:
         try:
             self.logger.debug(f"Navigating to next page: {next_url}")
 
-            response = await self.page.goto(next_url, wait_until="domcontentloaded")
+            # "commit" kehrt nach den Response-Headern zurück - auf die Inhalte
+            # wartet _wait_for_page_load
+            previous_url = self.page.url
+            timed_out = False
+            try:
+                response = await self.page.goto(
+                    next_url, wait_until="commit", timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                # Nicht fatal: die Navigation läuft im Browser weiter. Bis sie
+                # bestätigt ist, steht aber noch die alte Ergebnisseite da.
+                self.logger.debug(f"Navigation commit timed out for {next_url}")
+                response = None
+                timed_out = True
+                try:
+                    await self.page.wait_for_url(
+                        lambda url: url != previous_url,
+                        wait_until="commit",
+                        timeout=15000,
+                    )
+                except PlaywrightTimeoutError:
+                    self.logger.warning(f"Navigation to {next_url} did not commit")
+                    return False
+            self._invalidate_tree()
 
-            if response and response.status < 400:
+            if timed_out or (response and response.status < 400):
                 # Warten bis Inhalte geladen sind
                 await self._wait_for_page_load()
+                self._last_nav_ts = time.monotonic()
 
                 self.current_page += 1
                 self.logger.info(f"Successfully navigated to page {self.current_page}")
@@ -278,22 +634,17 @@ class PaginationHandler:
         """Wartet bis die Seite vollständig geladen ist"""
 
         try:
-            # Warten auf Suchergebnisse
-            result_selectors = [
-                ".search-results",
-                ".result-list",
-                '[class*="result"]',
-                '[class*="listing"]',
-                "article",
-            ]
-
-            for selector in result_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=10000)
-                    self.logger.debug(f"Page loaded, found results: {selector}")
-                    return True
-                except PlaywrightTimeoutError:
-                    continue
+            # Alle Ergebnis-Selektoren in einer Browser-Abfrage - erster Treffer gewinnt
+            try:
+                await self.page.wait_for_function(
+                    "selector => document.querySelector(selector) !== null",
+                    arg=JOINED_RESULTS,
+                    timeout=10000,
+                )
+                self.logger.debug("Page loaded, found results")
+                return True
+            except PlaywrightTimeoutError:
+                pass
 
             # Fallback: Kurz warten
             await asyncio.sleep(3)
@@ -307,44 +658,39 @@ class PaginationHandler:
         """Prüft ob wir uns noch auf einer Suchergebnisseite befinden"""
 
         try:
-            current_url = self.page.url.lower()
-            title = (await self.page.title()).lower()
-
-            # URL-basierte Prüfung
-            url_indicators = ["suche", "search", "hausverwaltung", "düsseldorf"]
-            if any(indicator in current_url for indicator in url_indicators):
+            # URL-basierte Prüfung (ohne Browser-Aufruf)
+            if URL_INDICATOR_RE.search(self.page.url):
                 return True
 
             # Titel-basierte Prüfung
-            title_indicators = ["hausverwaltung", "düsseldorf", "suche", "ergebnis"]
-            if any(indicator in title for indicator in title_indicators):
-                return True
-
-            # Element-basierte Prüfung
-            html_content = await self.page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            result_elements = soup.select(
-                '[class*="result"], [class*="listing"], article'
-            )
-            if len(result_elements) > 0:
+            if TITLE_INDICATOR_RE.search(await self._get_title()):
                 return True
 
-            return False
+            # Element-basierte Prüfung direkt im Browser statt über das HTML
+            return await self.page.locator(RESULT_ELEMENTS_SELECTOR).count() > 0
 
         except Exception as e:
             self.logger.error(f"Error checking if search results page: {e}")
             return False
 
     async def _wait_between_pages(self):
-        """Wartet zwischen Seitenaufrufen (ethisches Scraping)"""
+        """
+        Wartet zwischen Seitenaufrufen (ethisches Scraping)
+
+        Die Pause gilt ab der letzten Navigation - Zeit, die seitdem schon mit
+        Laden und Auswerten vergangen ist, wird abgezogen.
+        """
 
         min_delay = self.delay_between_pages.get("min", 2)
         max_delay = self.delay_between_pages.get("max", 5)
 
         delay = random.uniform(min_delay, max_delay)
-        self.logger.debug(f"Waiting {delay:.2f} seconds before next page...")
-        await asyncio.sleep(delay)
+        if self._last_nav_ts is not None:
+            delay -= time.monotonic() - self._last_nav_ts
+
+        if delay > 0:
+            self.logger.debug(f"Waiting {delay:.2f} seconds before next page...")
+            await asyncio.sleep(delay)
 
     async def get_pagination_info(self) -> Dict[str, Any]:
         """
@@ -354,64 +700,60 @@ class PaginationHandler:
             Dict mit Paginierungs-Informationen
         """
         try:
-            html_content = await self.page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
+            html_content = await self._get_html()
+            tree = await self._get_tree()
 
             pagination_info = {
                 "current_page": self.current_page,
-                "total_pages": None,
+                "total_pages": self._find_last_page_number(tree),
                 "has_next": False,
                 "has_previous": False,
                 "total_results": None,
             }
 
             # Suche nach Paginierungs-Elementen
-            pagination_selectors = [
-                ".pagination",
-                ".pager",
-                ".page-nav",
-                '[class*="pagination"]',
-                '[class*="pager"]',
-            ]
-
-            for selector in pagination_selectors:
+            for selector in PAGINATION_SELECTORS:
                 try:
-                    pagination = soup.select_one(selector)
+                    pagination = tree.css_first(selector)
                     if pagination:
                         # Aktuelle Seite
-                        current = pagination.select_one(
+                        current = pagination.css_first(
                             '.current, .active, [class*="current"]'
                         )
                         if current:
                             try:
                                 pagination_info["current_page"] = int(
-                                    current.get_text(strip=True)
+                                    current.text(strip=True)
                                 )
                             except:
                                 pass
 
-                        # Nächste/Vorherige Seite
-                        next_link = pagination.select_one(
-                            'a[rel="next"], a:contains("Weiter")'
-                        )
-                        prev_link = pagination.select_one(
-                            'a[rel="prev"], a:contains("Zurück")'
-                        )
-
-                        pagination_info["has_next"] = next_link is not None
-                        pagination_info["has_previous"] = prev_link is not None
+                        # Nächste/Vorherige Seite: erst über rel-Attribute, dann
+                        # ein gemeinsamer Durchlauf über die Linktexte
+                        has_next = pagination.css_first('a[rel="next"]') is not None
+                        has_prev = pagination.css_first('a[rel="prev"]') is not None
+                        if not (has_next and has_prev):
+                            for link in pagination.css("a"):
+                                text = link.text().lower()
+                                has_next = has_next or "weiter" in text
+                                has_prev = has_prev or "zurück" in text
+                                if has_next and has_prev:
+                                    break
+
+                        pagination_info["has_next"] = has_next
+                        pagination_info["has_previous"] = has_prev
 
                         break
                 except:
                     continue
 
-            # Suche nach Gesamtergebnis-Anzahl
+            # Suche nach Gesamtergebnis-Anzahl - meist direkt im rohen HTML zu finden
             try:
-                result_count_pattern = r"(\d+)\s*(Ergebnisse|Treffer|Einträge|results)"
-                text_content = soup.get_text()
-                match = re.search(result_count_pattern, text_content, re.IGNORECASE)
+                match = RESULT_COUNT_RE.search(html_content)
                 if match:
                     pagination_info["total_results"] = int(match.group(1))
+                else:
+                    pagination_info["total_results"] = self._find_result_count(tree)
             except:
                 pass
 
@@ -438,36 +780,19 @@ class PaginationHandler:
             bool: True wenn erfolgreich
         """
         try:
-            current_url = self.page.url
-
-            # Versuche URL-Parameter zu modifizieren
-            parsed = urlparse(current_url)
-            query_params = parse_qs(parsed.query)
-
-            # Häufige Parameter für Seitennummer
-            page_params = ["page", "seite", "p"]
-
-            for param in page_params:
-                if param in query_params:
-                    query_params[param] = [str(page_number)]
-
-                    # URL rekonstruieren
-                    from urllib.parse import urlencode
-
-                    new_query = urlencode(query_params, doseq=True)
-                    new_url = (
-                        f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{new_query}"
-                    )
-
-                    # Zur neuen URL navigieren
-                    response = await self.page.goto(
-                        new_url, wait_until="domcontentloaded"
-                    )
-
-                    if response and response.status < 400:
-                        await self._wait_for_page_load()
-                        self.current_page = page_number
-                        return True
+            # Versuche den Seitenparameter der URL zu ersetzen
+            new_url = self._replace_page_number(self.page.url, page_number)
+
+            if new_url:
+                # Zur neuen URL navigieren
+                response = await self.page.goto(new_url, wait_until="domcontentloaded")
+                self._invalidate_tree()
+
+                if response and response.status < 400:
+                    await self._wait_for_page_load()
+                    self._last_nav_ts = time.monotonic()
+                    self.current_page = page_number
+                    return True
 
             self.logger.warning(f"Could not navigate to page {page_number}")
             return False
@@ -4,21 +4,338 @@ Verwaltet Playwright Browser-Instanzen mit robusten Konfigurationen
 """
 
 import asyncio
+import gzip
 import random
+import re
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, Final, List, Set, Tuple
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlparse
 
 from playwright.async_api import (
     async_playwright,
     Browser,
     BrowserContext,
+    CDPSession,
     Page,
     Playwright,
+    Request,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
 )
-import yaml
+
+# Optional: Aho-Corasick-Automat für die URL-Blockliste
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from .yaml_cache import load_yaml_cached
+
+# Prozessweit geteilte Browser - ein Chromium-Start ist um ein Vielfaches teurer
+# als ein neuer Context. Pro Headless-Modus ein aktueller Browser, Referenzen
+# werden pro Browser-Objekt gezählt (auch für abgelöste, getrennte Browser).
+_playwright: Optional[Playwright] = None
+_browsers: Dict[bool, Browser] = {}
+_ref_counts: Dict[Browser, int] = {}
+_browser_lock: Optional[asyncio.Lock] = None
+# (Browser, User-Agent, Breite, Höhe) -> Pool wiederverwendbarer Contexts
+_context_pools: Dict[Tuple[Browser, str, int, int], "_ContextPool"] = {}
+
+DEFAULT_CONTEXT_POOL_SIZE: Final = 4
+
+# User agents für Rotation
+USER_AGENTS: Final[Tuple[str, ...]] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+# URLs die gar nicht erst geladen werden (Tracking, Werbung, Fonts)
+IGNORED_URL_SUBSTRINGS: Final[Tuple[str, ...]] = (
+    "fonts",  # Font-Loading Fehler
+    "google-analytics",  # Google Analytics
+    "googleads",  # Google Ads
+    "doubleclick",  # DoubleClick
+    "google.com/ads",  # Google Ads
+    "google.com/pagead",  # Google Ads
+    "google.de/pagead",  # Google Ads
+    "google-analytics.com/collect",  # Analytics
+    "static.11880.com/Portal/fonts",  # 11880 Fonts
+    "googlesyndication.com",  # Google Syndication
+    "pagead2.googlesyndication.com",  # Google Syndication spezifisch
+    "amazon-adsystem.com",  # Amazon Ads
+    "id5-sync.com",  # ID5 Tracking
+    "jsdelivr.net/gh/prebid",  # Prebid Currency Files
+    "adtrafficquality.google",  # Google Ad Traffic Quality
+    "sodar",  # Google Sodar Tracking
+    "google.com/ccm/collect",  # Google Consent Management
+    "googletagmanager.com",  # Google Tag Manager
+    "dnacdn.net",  # DNA CDN
+)
+BLOCKED_URL_RE: Final = re.compile(
+    "|".join(re.escape(url) for url in IGNORED_URL_SUBSTRINGS), re.IGNORECASE
+)
+
+
+def _build_url_matcher() -> Callable[[str], bool]:
+    """
+    Erstellt die Prüffunktion für die URL-Blockliste
+
+    Mit pyahocorasick wird die URL in einem Durchlauf gegen alle Einträge
+    geprüft, sonst über die vorkompilierte Regex-Alternation.
+    """
+    if ahocorasick is None:
+        return lambda url: BLOCKED_URL_RE.search(url) is not None
+
+    automaton = ahocorasick.Automaton()
+    for substring in IGNORED_URL_SUBSTRINGS:
+        automaton.add_word(substring.lower(), substring)
+    automaton.make_automaton()
+    return lambda url: next(automaton.iter(url.lower()), None) is not None
+
+
+_is_blocked_url: Final = _build_url_matcher()
+
+# Ressourcentypen, die für das Scraping nicht benötigt werden
+BLOCKED_RESOURCE_TYPES: Final = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_requests(route: Route) -> None:
+    """Route-Handler: bricht Tracking, Werbung und schwere Ressourcen vorab ab"""
+    request = route.request
+    resource_type = request.resource_type
+    # Dokumente nie blockieren - auch wenn die URL z.B. "fonts" enthält
+    if resource_type != "document" and (
+        resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_url(request.url)
+    ):
+        await route.abort("blockedbyclient")
+    else:
+        await route.continue_()
+
+
+BROWSER_ARGS: Final[Tuple[str, ...]] = (
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-images",  # Für bessere Performance
+)
+
+# Feste Context-Optionen - pro Pool kommen nur User-Agent und Viewport hinzu.
+# Accept-Encoding handelt Chromium selbst aus.
+_BASE_CONTEXT_OPTS: Final = MappingProxyType(
+    {
+        "java_script_enabled": True,
+        "ignore_https_errors": True,
+        "extra_http_headers": MappingProxyType(
+            {
+                "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Connection": "keep-alive",
+                "Upgrade-Insecure-Requests": "1",
+            }
+        ),
+    }
+)
+
+# Standardqualität für JPEG-Screenshots
+SCREENSHOT_JPEG_QUALITY: Final = 60
+
+# Scrollt im Browser bis die Seitenhöhe stabil bleibt - eine CDP-Runde statt
+# drei pro Scroll-Schritt
+SCROLL_TO_BOTTOM_JS: Final = """
+async ([pauseMs, maxIterations]) => {
+    let last = document.body.scrollHeight;
+    for (let i = 0; i < maxIterations; i++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise((resolve) => setTimeout(resolve, pauseMs));
+        const height = document.body.scrollHeight;
+        if (height === last) break;
+        last = height;
+    }
+}
+"""
+
+
+def _get_browser_lock() -> asyncio.Lock:
+    """Erstellt den Lock erst innerhalb der laufenden Event-Loop"""
+    global _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    return _browser_lock
+
+
+async def _acquire_browser(headless: bool) -> Browser:
+    """
+    Gibt den geteilten Browser zurück und startet ihn beim ersten Aufruf
+
+    Args:
+        headless: Headless-Modus des gewünschten Browsers
+
+    Returns:
+        Browser: Laufende Chromium-Instanz
+    """
+    global _playwright
+    async with _get_browser_lock():
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+
+        browser = _browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            if browser is not None:
+                # Pools des getrennten Browsers verwerfen
+                await _close_context_pools(browser)
+            browser = await _playwright.chromium.launch(
+                headless=headless, args=list(BROWSER_ARGS)
+            )
+            _browsers[headless] = browser
+
+        _ref_counts[browser] = _ref_counts.get(browser, 0) + 1
+        return browser
+
+
+async def _release_browser(browser: Browser, headless: bool) -> None:
+    """Gibt eine Referenz frei und schließt den Browser nach der letzten"""
+    global _playwright
+    async with _get_browser_lock():
+        _ref_counts[browser] = _ref_counts.get(browser, 1) - 1
+        if _ref_counts[browser] > 0:
+            return
+        del _ref_counts[browser]
+
+        # Nur den aktuellen Browser austragen - ein neu gestarteter Ersatz für
+        # einen getrennten Browser gehört anderen Instanzen
+        if _browsers.get(headless) is browser:
+            del _browsers[headless]
+        # Freie Contexts dieses Browsers schließen
+        await _close_context_pools(browser)
+        if browser.is_connected():
+            await browser.close()
+
+        if not _browsers and not _ref_counts and _playwright:
+            await _playwright.stop()
+            _playwright = None
+
+
+def _origin_of(url: str) -> Optional[str]:
+    """Gibt die Origin (Schema://Host) einer http(s)-URL zurück"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class _ContextPool:
+    """
+    Hält vorgewärmte BrowserContexts mit identischen Optionen bereit
+
+    Zurückgegebene Contexts werden von Seiten, Cookies und dem Speicher aller
+    besuchten Origins befreit und beim nächsten acquire() wiederverwendet,
+    statt jedes Mal neu erstellt zu werden.
+    """
+
+    def __init__(self, browser: Browser, options: Dict[str, Any], max_size: int):
+        self._browser = browser
+        self._options = options
+        self._idle: "asyncio.Queue[BrowserContext]" = asyncio.Queue(maxsize=max_size)
+        # Context -> Origins aller geladenen Dokumente (inkl. iframes)
+        self._origins: Dict[BrowserContext, Set[str]] = {}
+
+    async def acquire(self) -> BrowserContext:
+        """Gibt einen freien Context zurück oder erstellt einen neuen"""
+        try:
+            return self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            context = await self._browser.new_context(**self._options)
+            # Blockliste einmal pro Context - bleibt bei Wiederverwendung erhalten
+            await context.route("**/*", _block_requests)
+
+            origins: Set[str] = set()
+            self._origins[context] = origins
+
+            def track_origin(request: Request) -> None:
+                if request.resource_type == "document":
+                    origin = _origin_of(request.url)
+                    if origin:
+                        origins.add(origin)
+
+            context.on("request", track_origin)
+            return context
+
+    async def release(self, context: BrowserContext) -> None:
+        """Setzt den Context zurück und legt ihn in den Pool (oder schließt ihn)"""
+        try:
+            await self._clear_storage(context)
+            for page in context.pages:
+                await page.close()
+            await context.clear_cookies()
+            self._idle.put_nowait(context)
+        except Exception:
+            # Pool voll oder Context unbrauchbar (z.B. Browser getrennt)
+            await self._close_quietly(context)
+
+    async def _clear_storage(self, context: BrowserContext) -> None:
+        """
+        Löscht Local/Session Storage, IndexedDB, Cache Storage und HTTP-Cache
+
+        Ohne das würden z.B. Consent-Zustände an die nächste Instanz weitergegeben,
+        die diesen Context aus dem Pool erhält.
+        """
+        origins = self._origins.get(context, set())
+        page = context.pages[0] if context.pages else await context.new_page()
+        session = await context.new_cdp_session(page)
+        try:
+            for origin in origins:
+                await session.send(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"},
+                )
+            await session.send("Network.clearBrowserCache")
+        finally:
+            await session.detach()
+        origins.clear()
+
+    async def close(self) -> None:
+        """Schließt alle freien Contexts"""
+        while not self._idle.empty():
+            await self._close_quietly(self._idle.get_nowait())
+
+    async def _close_quietly(self, context: BrowserContext) -> None:
+        """Schließt einen Context und ignoriert Fehler eines toten Browsers"""
+        self._origins.pop(context, None)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+
+async def _close_context_pools(browser: Browser) -> None:
+    """Schließt und entfernt alle Context-Pools eines Browsers"""
+    for key in [key for key in _context_pools if key[0] is browser]:
+        await _context_pools.pop(key).close()
+
+
+def _get_context_pool(
+    browser: Browser,
+    user_agent: str,
+    viewport: Dict[str, int],
+    max_size: int,
+) -> _ContextPool:
+    """Gibt den Pool für diese Context-Optionen zurück (legt ihn bei Bedarf an)"""
+    key = (browser, user_agent, viewport["width"], viewport["height"])
+    pool = _context_pools.get(key)
+    if pool is None:
+        # Options-Dict wird nur für neue Pools gebaut
+        options = {"user_agent": user_agent, "viewport": viewport, **_BASE_CONTEXT_OPTS}
+        pool = _ContextPool(browser, options, max_size)
+        _context_pools[key] = pool
+    return pool
 
 
 class BrowserManager:
@@ -28,42 +345,84 @@ class BrowserManager:
     """
 
     def __init__(
-        self, headless: Optional[bool] = None, config_path: str = "config/settings.yaml"
+        self,
+        headless: Optional[bool] = None,
+        config_path: str = "config/settings.yaml",
+        config: Optional[Dict[str, Any]] = None,
     ):
+        self.logger = logging.getLogger(__name__)
         self.config_path = config_path
-        self.config = self._load_config()
+        if config is None:
+            config = self._load_config(config_path)
+        self.config = config
+        self._apply_config()
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._cdp_session: Optional[CDPSession] = None
         self.headless_override = headless
+        self._is_headless: Optional[bool] = None
+        self._context_pool: Optional[_ContextPool] = None
 
-        # Setup logging
-        self.logger = logging.getLogger(__name__)
-        self._setup_logging()
-
-        # User agents für Rotation
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        ]
-
-    def _load_config(self) -> Dict[str, Any]:
+    @classmethod
+    async def create(
+        cls, headless: Optional[bool] = None, config_path: str = "config/settings.yaml"
+    ) -> "BrowserManager":
+        """
+        Async-Factory für den Aufruf aus einer laufenden Event-Loop
+
+        Lesen und Parsen der Konfiguration laufen in einem Worker-Thread, damit
+        die Event-Loop nicht blockiert. Der synchrone Konstruktor bleibt erhalten.
+
+        Args:
+            headless: Optionaler Override für den Headless-Modus
+            config_path: Pfad zur Konfigurationsdatei
+
+        Returns:
+            BrowserManager: Initialisierte Instanz
+        """
+        # run_in_executor statt asyncio.to_thread - läuft auch unter Python 3.8
+        config = await asyncio.get_running_loop().run_in_executor(
+            None, cls._load_config, config_path
+        )
+        return cls(headless, config_path, config=config)
+
+    @staticmethod
+    def _load_config(config_path: str) -> Dict[str, Any]:
         """Lädt die Konfiguration aus der YAML-Datei"""
+        logger = logging.getLogger(__name__)
         try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                return yaml.safe_load(file)
+            return load_yaml_cached(config_path)
         except FileNotFoundError:
-            self.logger.warning(f"Config file not found: {self.config_path}")
-            return self._default_config()
+            logger.warning("Config file not found: %s", config_path)
+            return BrowserManager._default_config()
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
-            return self._default_config()
+            logger.error("Error loading config: %s", e)
+            return BrowserManager._default_config()
+
+    def _apply_config(self) -> None:
+        """Liest häufig benötigte Werte einmalig aus der Konfiguration"""
+        browser_config = self.config.get("browser", {})
+        scraping_config = self.config.get("scraping", {})
+        delay_config = scraping_config.get("delay_between_requests", {})
+
+        self._headless_default = browser_config.get("headless", True)
+        self._timeout = browser_config.get("timeout", 30000)
+        # Playwright serialisiert nur echte Dicts - der Cache liefert MappingProxyType
+        self._viewport = dict(
+            browser_config.get("viewport", {"width": 1920, "height": 1080})
+        )
+        self._context_pool_size = browser_config.get(
+            "context_pool_size", DEFAULT_CONTEXT_POOL_SIZE
+        )
+        self._retry_attempts = scraping_config.get("retry_attempts", 5)
+        self._retry_delay = scraping_config.get("retry_delay", 2)
+        self._min_delay = delay_config.get("min", 2)
+        self._max_delay = delay_config.get("max", 5)
 
-    def _default_config(self) -> Dict[str, Any]:
+    @staticmethod
+    def _default_config() -> Dict[str, Any]:
         """Standard-Konfiguration falls keine Datei vorhanden ist"""
         return {
             "browser": {
@@ -78,13 +437,6 @@ class BrowserManager:
             },
         }
 
-    def _setup_logging(self):
-        """Konfiguriert das Logging für den BrowserManager"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
-
     async def start_browser(self) -> Page:
         """
         Startet den Browser und erstellt eine neue Seite
@@ -95,114 +447,99 @@ class BrowserManager:
         try:
             self.logger.info("Starting browser...")
 
-            # Playwright starten
-            self.playwright = await async_playwright().start()
-
-            # Browser konfigurieren
-            browser_config = self.config.get("browser", {})
-
             # Headless-Modus bestimmen (Override > Config > Default)
             is_headless = self.headless_override
             if is_headless is None:
-                is_headless = browser_config.get("headless", True)
-
-            self.browser = await self.playwright.chromium.launch(
-                headless=is_headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-images",  # Für bessere Performance
-                ],
-            )
+                is_headless = self._headless_default
+
+            # Geteilten Browser verwenden - nur Context und Seite sind pro Instanz
+            self.browser = await _acquire_browser(is_headless)
+            self._is_headless = is_headless
+            self.playwright = _playwright
 
             # Browser Context mit zufälligem User-Agent
-            user_agent = random.choice(self.user_agents)
-            viewport = browser_config.get("viewport", {"width": 1920, "height": 1080})
-
-            self.context = await self.browser.new_context(
-                user_agent=user_agent,
-                viewport=viewport,
-                java_script_enabled=True,
-                ignore_https_errors=True,
-                extra_http_headers={
-                    "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                },
+            user_agent = random.choice(USER_AGENTS)
+
+            # Context aus dem Pool - wird bei cleanup() zurückgegeben statt geschlossen
+            self._context_pool = _get_context_pool(
+                self.browser,
+                user_agent,
+                self._viewport,
+                self._context_pool_size,
             )
+            self.context = await self._context_pool.acquire()
 
             # Neue Seite erstellen
             self.page = await self.context.new_page()
 
             # Timeout konfigurieren
-            timeout = browser_config.get("timeout", 30000)
-            self.page.set_default_timeout(timeout)
+            self.page.set_default_timeout(self._timeout)
+
+            # CDP-Session für das Zurücksetzen des Speichers bei Retries
+            self._cdp_session = await self.context.new_cdp_session(self.page)
 
             # Event-Handler für besseres Debugging
             self.page.on("response", self._on_response)
             self.page.on("requestfailed", self._on_request_failed)
 
             self.logger.info(
-                f"Browser started successfully with User-Agent: {user_agent}"
+                "Browser started successfully with User-Agent: %s", user_agent
             )
             return self.page
 
         except Exception as e:
-            self.logger.error(f"Failed to start browser: {e}")
+            self.logger.error("Failed to start browser: %s", e)
             await self.cleanup()
             raise
 
+    async def new_page(self) -> Page:
+        """
+        Erstellt eine zusätzliche Seite im bestehenden Browser-Context
+
+        Returns:
+            Page: Neue Seite mit denselben Timeouts und Event-Handlern
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
+
+        page = await self.context.new_page()
+        page.set_default_timeout(self._timeout)
+        page.on("response", self._on_response)
+        page.on("requestfailed", self._on_request_failed)
+        return page
+
     async def _on_response(self, response):
         """Event-Handler für HTTP-Responses"""
         if response.status >= 400:
-            self.logger.warning(f"HTTP {response.status}: {response.url}")
+            self.logger.warning("HTTP %d: %s", response.status, response.url)
 
     async def _on_request_failed(self, request):
         """Event-Handler für fehlgeschlagene Requests"""
-        # URLs die ignoriert werden sollen
-        ignored_urls = [
-            "fonts",  # Font-Loading Fehler
-            "google-analytics",  # Google Analytics
-            "googleads",  # Google Ads
-            "doubleclick",  # DoubleClick
-            "google.com/ads",  # Google Ads
-            "google.com/pagead",  # Google Ads
-            "google.de/pagead",  # Google Ads
-            "google-analytics.com/collect",  # Analytics
-            "static.11880.com/Portal/fonts",  # 11880 Fonts
-            "googlesyndication.com",  # Google Syndication
-            "pagead2.googlesyndication.com",  # Google Syndication spezifisch
-            "amazon-adsystem.com",  # Amazon Ads
-            "id5-sync.com",  # ID5 Tracking
-            "jsdelivr.net/gh/prebid",  # Prebid Currency Files
-            "adtrafficquality.google",  # Google Ad Traffic Quality
-            "sodar",  # Google Sodar Tracking
-            "google.com/ccm/collect",  # Google Consent Management
-            "googletagmanager.com",  # Google Tag Manager
-            "dnacdn.net",  # DNA CDN
-        ]
-
-        # Prüfen ob die URL ignoriert werden soll
-        url = request.url.lower()
-        if not any(ignored_url in url for ignored_url in ignored_urls):
-            error_message = (
-                str(request.failure) if hasattr(request, "failure") else "Unknown error"
-            )
-            # Ignore ERR_ABORTED errors as they are usually just navigation cancellations
-            if "net::ERR_ABORTED" not in error_message:
-                self.logger.error(f"Request failed: {request.url} - {error_message}")
-
-    async def navigate_to(self, url: str, wait_for: Optional[str] = None) -> bool:
+        error_message = (
+            str(request.failure) if hasattr(request, "failure") else "Unknown error"
+        )
+        # Ignore ERR_ABORTED errors as they are usually just navigation cancellations
+        # and ERR_BLOCKED_BY_CLIENT from our own route blocking
+        if (
+            "net::ERR_ABORTED" not in error_message
+            and "net::ERR_BLOCKED_BY_CLIENT" not in error_message
+        ):
+            self.logger.error("Request failed: %s - %s", request.url, error_message)
+
+    async def navigate_to(
+        self,
+        url: str,
+        wait_for: Optional[str] = None,
+        ready_selector_fallback: Optional[str] = "body",
+    ) -> bool:
         """
         Navigiert zu einer URL mit robusten Wartezeiten
 
         Args:
             url: Ziel-URL
             wait_for: CSS-Selektor auf den gewartet werden soll
+            ready_selector_fallback: Selektor, auf den kurz gewartet wird, falls
+                kein wait_for angegeben ist
 
         Returns:
             bool: True wenn erfolgreich, False sonst
@@ -211,29 +548,26 @@ class BrowserManager:
             raise RuntimeError("Browser not started. Call start_browser() first.")
 
         try:
-            self.logger.info(f"Navigating to: {url}")
+            self.logger.info("Navigating to: %s", url)
 
             # Navigation mit Retry-Logik
-            retry_attempts = self.config.get("scraping", {}).get("retry_attempts", 5)
-            base_delay = self.config.get("scraping", {}).get("retry_delay", 2)
+            retry_attempts = self._retry_attempts
+            base_delay = self._retry_delay
 
             for attempt in range(retry_attempts):
                 try:
                     # Clear cache and cookies before navigation
                     if attempt > 0:  # Only clear on retry attempts
-                        await self.context.clear_cookies()
-                        await self.page.evaluate("() => window.localStorage.clear()")
-                        await self.page.evaluate("() => window.sessionStorage.clear()")
+                        await self._clear_origin_storage(url)
 
-                    # Navigate with longer timeout
+                    # Nur auf das DOM warten - networkidle hängt bei Analytics
+                    # mit Keepalive oft zehn Sekunden und mehr
                     response = await self.page.goto(
-                        url,
-                        wait_until="networkidle",  # Wait for network to be idle
-                        timeout=60000,  # 60 second timeout
+                        url, wait_until="domcontentloaded", timeout=self._timeout
                     )
 
                     if response and response.status < 400:
-                        self.logger.info(f"Successfully navigated to {url}")
+                        self.logger.info("Successfully navigated to %s", url)
 
                         # Wait for specific selector if provided
                         if wait_for:
@@ -243,41 +577,57 @@ class BrowserManager:
                                 state="visible",  # Ensure element is visible
                             )
                             self.logger.info(
-                                f"Successfully waited for selector: {wait_for}"
+                                "Successfully waited for selector: %s", wait_for
                             )
-
-                        # Additional wait for dynamic content
-                        await asyncio.sleep(2)
+                        elif ready_selector_fallback:
+                            try:
+                                await self.page.wait_for_selector(
+                                    ready_selector_fallback,
+                                    timeout=5000,
+                                    state="attached",
+                                )
+                            except PlaywrightTimeoutError:
+                                self.logger.debug(
+                                    "Ready selector not found: %s",
+                                    ready_selector_fallback,
+                                )
 
                         return True
                     else:
-                        error_msg = f"Navigation returned status {response.status if response else 'None'}"
-                        self.logger.warning(error_msg)
-
-                        if attempt == retry_attempts - 1:
+                        self.logger.warning(
+                            "Navigation returned status %s",
+                            response.status if response else None,
+                        )
+
+                        # Debug-Infos nur speichern, wenn DEBUG-Logging aktiv ist
+                        if attempt == retry_attempts - 1 and self.logger.isEnabledFor(
+                            logging.DEBUG
+                        ):
                             # Save page content on last failed attempt
                             try:
                                 html = await self.page.content()
                                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                                with open(
-                                    f"logs/failed_page_{timestamp}.html",
-                                    "w",
+                                with gzip.open(
+                                    f"logs/failed_page_{timestamp}.html.gz",
+                                    "wt",
                                     encoding="utf-8",
                                 ) as f:
                                     f.write(html)
                                 await self.take_screenshot(
-                                    f"failed_page_{timestamp}.png"
+                                    f"failed_page_{timestamp}.jpg"
                                 )
                             except Exception as e:
-                                self.logger.error(f"Failed to save debug info: {e}")
+                                self.logger.error("Failed to save debug info: %s", e)
 
                 except Exception as e:
-                    self.logger.warning(f"Navigation attempt {attempt + 1} failed: {e}")
+                    self.logger.warning(
+                        "Navigation attempt %d failed: %s", attempt + 1, e
+                    )
 
                     if attempt < retry_attempts - 1:
                         # Exponential backoff with jitter
                         delay = (base_delay ** (attempt + 1)) + random.uniform(0, 1)
-                        self.logger.info(f"Retrying in {delay:.2f} seconds...")
+                        self.logger.info("Retrying in %.2f seconds...", delay)
                         await asyncio.sleep(delay)
                     else:
                         raise
@@ -285,25 +635,43 @@ class BrowserManager:
             return False
 
         except Exception as e:
-            self.logger.error(f"Failed to navigate to {url}: {e}")
+            self.logger.error("Failed to navigate to %s: %s", url, e)
             return False
 
+    async def _clear_origin_storage(self, url: str) -> None:
+        """
+        Löscht Cookies, Local/Session Storage, IndexedDB und Cache einer Origin
+
+        Ein einzelner CDP-Aufruf statt clear_cookies() und zwei evaluate()-Runden.
+        """
+        origin = _origin_of(url)
+        if origin is None:
+            return
+        await self._cdp_session.send(
+            "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+        )
+
     async def wait_human_like(self):
         """Wartet eine zufällige Zeit um menschliches Verhalten zu simulieren"""
-        delay_config = self.config.get("scraping", {}).get("delay_between_requests", {})
-        min_delay = delay_config.get("min", 2)
-        max_delay = delay_config.get("max", 5)
-
-        delay = random.uniform(min_delay, max_delay)
-        self.logger.debug(f"Waiting {delay:.2f} seconds...")
+        delay = random.uniform(self._min_delay, self._max_delay)
+        self.logger.debug("Waiting %.2f seconds...", delay)
         await asyncio.sleep(delay)
 
-    async def take_screenshot(self, filename: Optional[str] = None) -> str:
+    async def take_screenshot(
+        self,
+        filename: Optional[str] = None,
+        full_page: bool = False,
+        quality: Optional[int] = None,
+    ) -> str:
         """
         Macht einen Screenshot der aktuellen Seite
 
+        Endet der Dateiname auf .jpg, wird ein JPEG statt PNG gespeichert.
+
         Args:
             filename: Optionaler Dateiname, sonst wird Timestamp verwendet
+            full_page: Ganze Seite statt nur des sichtbaren Bereichs aufnehmen
+            quality: JPEG-Qualität (0-100), Standard ist SCREENSHOT_JPEG_QUALITY
 
         Returns:
             str: Pfad zur Screenshot-Datei
@@ -318,8 +686,16 @@ class BrowserManager:
         screenshot_path = Path("logs") / filename
         screenshot_path.parent.mkdir(exist_ok=True)
 
-        await self.page.screenshot(path=str(screenshot_path), full_page=True)
-        self.logger.info(f"Screenshot saved: {screenshot_path}")
+        if screenshot_path.suffix.lower() in (".jpg", ".jpeg"):
+            await self.page.screenshot(
+                path=str(screenshot_path),
+                full_page=full_page,
+                type="jpeg",
+                quality=SCREENSHOT_JPEG_QUALITY if quality is None else quality,
+            )
+        else:
+            await self.page.screenshot(path=str(screenshot_path), full_page=full_page)
+        self.logger.info("Screenshot saved: %s", screenshot_path)
         return str(screenshot_path)
 
     async def get_page_content(self) -> str:
@@ -343,12 +719,15 @@ class BrowserManager:
         self.logger.info("No active page found. Starting new browser session.")
         return await self.start_browser()
 
-    async def scroll_to_bottom(self, pause_time: float = 1.0) -> bool:
+    async def scroll_to_bottom(
+        self, pause_time: float = 1.0, max_iterations: int = 50
+    ) -> bool:
         """
         Scrollt langsam zum Ende der Seite um dynamische Inhalte zu laden
 
         Args:
             pause_time: Pause zwischen Scroll-Aktionen
+            max_iterations: Maximale Anzahl an Scroll-Schritten
 
         Returns:
             bool: True wenn erfolgreich
@@ -357,54 +736,46 @@ class BrowserManager:
             return False
 
         try:
-            # Aktuelle Höhe abrufen
-            previous_height = await self.page.evaluate("document.body.scrollHeight")
-
-            while True:
-                # Zum Ende scrollen
-                await self.page.evaluate(
-                    "window.scrollTo(0, document.body.scrollHeight)"
-                )
-                await asyncio.sleep(pause_time)
-
-                # Neue Höhe prüfen
-                new_height = await self.page.evaluate("document.body.scrollHeight")
-
-                if new_height == previous_height:
-                    break
-
-                previous_height = new_height
+            await self.page.evaluate(
+                SCROLL_TO_BOTTOM_JS, [int(pause_time * 1000), max_iterations]
+            )
 
             self.logger.info("Finished scrolling to bottom")
             return True
 
         except Exception as e:
-            self.logger.error(f"Error scrolling to bottom: {e}")
+            self.logger.error("Error scrolling to bottom: %s", e)
             return False
 
     async def cleanup(self):
         """Räumt alle Browser-Ressourcen auf"""
         try:
-            if self.page:
-                await self.page.close()
-                self.page = None
-
-            if self.context:
-                await self.context.close()
-                self.context = None
-
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
+            try:
+                if self.page:
+                    page = self.page
+                    self.page = None
+                    self._cdp_session = None
+                    await page.close()
+
+                if self.context:
+                    context = self.context
+                    self.context = None
+                    if self._context_pool:
+                        await self._context_pool.release(context)
+                    else:
+                        await context.close()
+            finally:
+                # Geteilter Browser wird erst nach der letzten Referenz geschlossen
+                if self.browser:
+                    browser = self.browser
+                    self.browser = None
+                    self.playwright = None
+                    await _release_browser(browser, self._is_headless)
 
             self.logger.info("Browser cleanup completed")
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
 
     async def __aenter__(self):
         """Context Manager Entry"""
@@ -418,7 +789,7 @@ class BrowserManager:
 # Beispiel für die Verwendung
 async def example_usage():
     """Beispiel-Code für die Verwendung des BrowserManagers"""
-    browser_manager = BrowserManager()
+    browser_manager = await BrowserManager.create()
 
     try:
         page = await browser_manager.start_browser()
@@ -3,15 +3,56 @@ Logging Configuration für 11880.com Email Scraper
 Zentralisierte Logging-Konfiguration mit verschiedenen Levels und Ausgabeformaten
 """
 
+import atexit
+import gzip
 import logging
 import logging.handlers
 import os
+import queue
+import shutil
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Final
 
-import yaml
+from .yaml_cache import load_yaml_cached
+
+# Log-Level-Namen aus der Konfiguration -> logging-Konstanten
+_LEVEL_MAP: Final[Dict[str, int]] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+_CONSOLE_FORMATTER: Final = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_FILE_FORMATTER: Final = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Root-Handler werden nur einmal pro Prozess eingerichtet
+_INITIALIZED = False
+
+# Hintergrund-Thread, der die Datei-Handler bedient
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@lru_cache(maxsize=None)
+def _get_named_logger(name: str) -> logging.Logger:
+    """Holt einen Logger und setzt Sonder-Level nur beim ersten Zugriff"""
+    logger = logging.getLogger(name)
+
+    # Performance-Logger für spezielle Metriken
+    if name.endswith(".performance"):
+        logger.setLevel(logging.DEBUG)
+
+    return logger
 
 
 class ScraperLogger:
@@ -23,15 +64,13 @@ class ScraperLogger:
     def __init__(self, config_path: str = "config/settings.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
-        self.loggers: Dict[str, logging.Logger] = {}
         self._setup_base_logging()
 
     def _load_config(self) -> Dict[str, Any]:
         """Lädt die Logging-Konfiguration aus der YAML-Datei"""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
-                return config.get("logging", {})
+            config = load_yaml_cached(self.config_path)
+            return config.get("logging", {})
         except FileNotFoundError:
             return self._default_logging_config()
         except Exception:
@@ -47,7 +86,12 @@ class ScraperLogger:
         }
 
     def _setup_base_logging(self):
-        """Konfiguriert das Basis-Logging-System"""
+        """Konfiguriert das Basis-Logging-System (nur beim ersten Aufruf)"""
+        global _INITIALIZED, _listener
+        if _INITIALIZED:
+            return
+        _INITIALIZED = True
+
         # Log-Verzeichnis erstellen
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
@@ -62,33 +106,44 @@ class ScraperLogger:
 
         # Console Handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         console_handler.setLevel(logging.INFO)
         root_logger.addHandler(console_handler)
 
-        # File Handler (falls aktiviert)
+        # File Handler (falls aktiviert) - Schreibzugriffe laufen über eine Queue
+        # in einem eigenen Thread, damit der asyncio-Loop nicht blockiert
         if self.config.get("log_to_file", True):
             file_handler = self._create_file_handler()
             if file_handler:
-                root_logger.addHandler(file_handler)
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+                _listener = logging.handlers.QueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                _listener.start()
+                atexit.register(_listener.stop)
 
     def _get_log_level(self) -> int:
         """Konvertiert Log-Level String zu logging Konstante"""
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-        }
-        return level_map.get(self.config.get("level", "INFO").upper(), logging.INFO)
+        return _LEVEL_MAP.get(self.config.get("level", "INFO").upper(), logging.INFO)
+
+    @staticmethod
+    def _gzip_namer(name: str) -> str:
+        """Dateiname für rotierte Logs (werden gzip-komprimiert)"""
+        return name + ".gz"
+
+    @staticmethod
+    def _gzip_rotator(source: str, dest: str) -> None:
+        """Komprimiert die rotierte Log-Datei und entfernt das Original"""
+        # Bei delay=True existiert die Datei vor dem ersten Schreiben noch nicht
+        if not os.path.exists(source):
+            return
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
 
     def _create_file_handler(self) -> Optional[logging.Handler]:
-        """Erstellt einen File Handler mit Rotation"""
+        """Erstellt einen File Handler mit täglicher, komprimierter Rotation"""
         try:
             # Log-Datei-Pfad generieren
             log_file_template = self.config.get("log_file", "logs/scraper_{date}.log")
@@ -99,20 +154,19 @@ class ScraperLogger:
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Rotating File Handler erstellen
-            file_handler = logging.handlers.RotatingFileHandler(
+            # Rotation um Mitternacht, alte Dateien gzip-komprimiert. Die Datei
+            # wird erst beim ersten Schreibzugriff geöffnet.
+            file_handler = logging.handlers.TimedRotatingFileHandler(
                 log_file,
-                maxBytes=10 * 1024 * 1024,  # 10 MB
+                when="midnight",
                 backupCount=self.config.get("max_log_files", 10),
                 encoding="utf-8",
+                delay=True,
             )
+            file_handler.namer = self._gzip_namer
+            file_handler.rotator = self._gzip_rotator
 
-            # File Formatter
-            file_formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_FILE_FORMATTER)
             file_handler.setLevel(self._get_log_level())
 
             return file_handler
@@ -131,24 +185,15 @@ class ScraperLogger:
         Returns:
             logging.Logger: Konfigurierter Logger
         """
-        if name not in self.loggers:
-            logger = logging.getLogger(name)
-
-            # Performance-Logger für spezielle Metriken
-            if name.endswith(".performance"):
-                logger.setLevel(logging.DEBUG)
-
-            self.loggers[name] = logger
-
-        return self.loggers[name]
+        return _get_named_logger(name)
 
     def log_scraping_start(self, target_url: str, search_params: Dict[str, Any]):
         """Loggt den Start eines Scraping-Vorgangs"""
         logger = self.get_logger("scraper.main")
         logger.info("=" * 50)
         logger.info("SCRAPING SESSION STARTED")
-        logger.info(f"Target URL: {target_url}")
-        logger.info(f"Search Parameters: {search_params}")
+        logger.info("Target URL: %s", target_url)
+        logger.info("Search Parameters: %s", search_params)
         logger.info("=" * 50)
 
     def log_scraping_end(self, total_extracted: int, duration: float):
@@ -156,22 +201,25 @@ class ScraperLogger:
         logger = self.get_logger("scraper.main")
         logger.info("=" * 50)
         logger.info("SCRAPING SESSION COMPLETED")
-        logger.info(f"Total extracted entries: {total_extracted}")
-        logger.info(f"Duration: {duration:.2f} seconds")
+        logger.info("Total extracted entries: %d", total_extracted)
+        logger.info("Duration: %.2f seconds", duration)
         logger.info("=" * 50)
 
     def log_page_extraction(self, page_num: int, extracted_count: int, page_url: str):
         """Loggt die Extraktion einer einzelnen Seite"""
         logger = self.get_logger("scraper.extraction")
         logger.info(
-            f"Page {page_num}: Extracted {extracted_count} entries from {page_url}"
+            "Page %d: Extracted %d entries from %s", page_num, extracted_count, page_url
         )
 
     def log_email_extraction(self, company_name: str, email: str, source: str):
         """Loggt eine erfolgreiche E-Mail-Extraktion"""
         logger = self.get_logger("scraper.email")
         logger.info(
-            f"Email found - Company: {company_name}, Email: {email}, Source: {source}"
+            "Email found - Company: %s, Email: %s, Source: %s",
+            company_name,
+            email,
+            source,
         )
 
     def log_error_with_screenshot(
@@ -179,21 +227,23 @@ class ScraperLogger:
     ):
         """Loggt einen Fehler mit optionalem Screenshot-Pfad"""
         logger = self.get_logger("scraper.error")
-        logger.error(f"Error occurred: {error_msg}")
+        logger.error("Error occurred: %s", error_msg)
         if screenshot_path:
-            logger.error(f"Screenshot saved: {screenshot_path}")
+            logger.error("Screenshot saved: %s", screenshot_path)
 
     def log_performance_metric(self, metric_name: str, value: float, unit: str = ""):
         """Loggt Performance-Metriken"""
         logger = self.get_logger("scraper.performance")
-        logger.debug(f"METRIC - {metric_name}: {value} {unit}")
+        logger.debug("METRIC - %s: %s %s", metric_name, value, unit)
 
     def log_retry_attempt(
         self, operation: str, attempt: int, max_attempts: int, error: str
     ):
         """Loggt Retry-Versuche"""
         logger = self.get_logger("scraper.retry")
-        logger.warning(f"Retry {attempt}/{max_attempts} for {operation}: {error}")
+        logger.warning(
+            "Retry %d/%d for %s: %s", attempt, max_attempts, operation, error
+        )
 
 
 # Globale Logger-Instanz
@@ -234,23 +284,18 @@ def setup_logging(level: Optional[str] = None, config_path: Optional[str] = None
         level = level.upper()
         log_level = _scraper_logger._get_log_level()  # get default
 
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-        }
-
-        new_level = level_map.get(level, log_level)
+        new_level = _LEVEL_MAP.get(level, log_level)
 
         # Level für alle Handler des Root-Loggers setzen
         root_logger = logging.getLogger()
         root_logger.setLevel(new_level)
         for handler in root_logger.handlers:
             handler.setLevel(new_level)
+        if _listener:
+            for handler in _listener.handlers:
+                handler.setLevel(new_level)
 
-        _scraper_logger.get_logger("main").info(f"Log level set to {level}")
+        _scraper_logger.get_logger("main").info("Log level set to %s", level)
 
 
 # Convenience-Funktionen für schnellen Zugriff
@@ -0,0 +1,159 @@
+"""
+YAML-Cache für 11880.com Email Scraper
+Vermeidet wiederholtes Lesen und Parsen der Konfigurationsdatei
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Final, Mapping, Optional, Set, Tuple
+
+import yaml
+
+# Optional: Dateisystem-Events statt os.stat() bei jedem Zugriff
+try:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    PatternMatchingEventHandler = None
+    Observer = None
+
+# libyaml-Loader in C, falls PyYAML damit gebaut wurde
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Maximale Anzahl gecachter Dateien (älteste werden zuerst verworfen)
+MAX_CACHE_ENTRIES: Final = 100
+
+# Pfad -> (mtime in ns, Größe, geparster Inhalt)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+
+# Der Observer-Thread entfernt Einträge parallel zu Lesezugriffen
+_cache_lock = threading.Lock()
+
+# Verzeichnisse, deren Änderungen der Observer meldet. Eigener Lock statt
+# _cache_lock: der Observer-Thread hält beim Dispatch seinen Lock und wartet auf
+# _cache_lock - schedule() unter _cache_lock könnte sonst verklemmen.
+_watch_lock = threading.Lock()
+_watched_dirs: Set[str] = set()
+_observer: Optional["Observer"] = None
+
+
+if PatternMatchingEventHandler is not None:
+
+    class _InvalidationHandler(PatternMatchingEventHandler):
+        """Verwirft Cache-Einträge geänderter, verschobener oder gelöschter Dateien"""
+
+        def on_any_event(self, event) -> None:
+            paths = [event.src_path, getattr(event, "dest_path", "")]
+            with _cache_lock:
+                for path in filter(None, paths):
+                    _YAML_CACHE.pop(os.path.abspath(path), None)
+
+
+def _watch_directory(directory: str) -> bool:
+    """
+    Startet bei Bedarf den Observer und überwacht das Verzeichnis
+
+    Returns:
+        bool: True wenn das Verzeichnis überwacht wird
+    """
+    global _observer
+    if Observer is None:
+        return False
+
+    # Mehrere Executor-Threads (BrowserManager.create) können gleichzeitig laden
+    with _watch_lock:
+        if directory in _watched_dirs:
+            return True
+
+        try:
+            if _observer is None:
+                _observer = Observer()
+                _observer.daemon = True
+                _observer.start()
+            _observer.schedule(
+                _InvalidationHandler(patterns=["*.yaml", "*.yml"]), directory
+            )
+        except Exception:
+            # z.B. inotify-Limit erreicht - dann bleibt es bei os.stat()
+            return False
+
+        _watched_dirs.add(directory)
+        return True
+
+
+def _freeze(value: Any) -> Any:
+    """Wandelt Dicts rekursiv in schreibgeschützte Views und Listen in Tupel um"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Erzeugt eine veränderbare Kopie eines Werts aus load_yaml_cached
+
+    Für Aufrufer, die die Konfiguration zur Laufzeit anpassen müssen.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def load_yaml_cached(path: str) -> Any:
+    """
+    Lädt eine YAML-Datei und parst sie nur, wenn sie sich geändert hat
+
+    Ist watchdog installiert, werden Einträge bei Dateiänderungen sofort
+    verworfen und Treffer kommen ohne Systemaufruf aus. Ohne watchdog bleibt ein
+    Eintrag gültig, solange Änderungszeit und Größe der Datei gleich sind.
+    Zurückgegeben wird eine schreibgeschützte Ansicht (Dicts als
+    MappingProxyType, Listen als Tupel), die ohne Kopie geteilt werden kann.
+    Wer Werte ändern muss, erzeugt mit thaw() eine eigene Kopie.
+
+    Args:
+        path: Pfad zur YAML-Datei
+
+    Returns:
+        Any: Geparster Inhalt der Datei (schreibgeschützt)
+
+    Raises:
+        FileNotFoundError: Wenn die Datei nicht existiert
+    """
+    key = os.path.abspath(path)
+    directory = os.path.dirname(key)
+
+    with _cache_lock:
+        entry = _YAML_CACHE.get(key)
+        if entry and directory in _watched_dirs:
+            _YAML_CACHE.move_to_end(key)
+            return entry[2]
+
+    stat = os.stat(key)
+    if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        with _cache_lock:
+            if key in _YAML_CACHE:
+                _YAML_CACHE.move_to_end(key)
+        return entry[2]
+
+    # Überwachung vor dem Lesen starten, damit keine Änderung verloren geht
+    _watch_directory(directory)
+
+    with open(key, "r", encoding="utf-8") as file:
+        data = _freeze(yaml.load(file, Loader=_SafeLoader))
+
+    with _cache_lock:
+        _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > MAX_CACHE_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+
+    return data
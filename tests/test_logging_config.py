@@ -0,0 +1,59 @@
+"""
+Tests für die Log-Rotation in logging_config
+"""
+
+import gzip
+import logging
+import logging.handlers
+import time
+
+from src.utils.logging_config import ScraperLogger
+
+
+def _make_handler(log_file):
+    handler = logging.handlers.TimedRotatingFileHandler(
+        str(log_file), when="midnight", backupCount=3, encoding="utf-8", delay=True
+    )
+    handler.namer = ScraperLogger._gzip_namer
+    handler.rotator = ScraperLogger._gzip_rotator
+    return handler
+
+
+def _record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_rollover_before_first_write(tmp_path):
+    """Rollover ohne vorhandene Datei darf das Logging nicht dauerhaft stören"""
+    log_file = tmp_path / "scraper.log"
+    handler = _make_handler(log_file)
+    handler.rolloverAt = 0  # Rollover sofort fällig, Datei noch nicht geöffnet
+
+    try:
+        handler.emit(_record("first"))
+        handler.emit(_record("second"))
+    finally:
+        handler.close()
+
+    assert handler.rolloverAt > time.time()
+    assert log_file.read_text(encoding="utf-8").splitlines() == ["first", "second"]
+    assert not list(tmp_path.glob("*.gz"))
+
+
+def test_rollover_compresses_previous_file(tmp_path):
+    """Bestehende Log-Datei wird beim Rollover gzip-komprimiert"""
+    log_file = tmp_path / "scraper.log"
+    handler = _make_handler(log_file)
+
+    try:
+        handler.emit(_record("old"))
+        handler.rolloverAt = 0
+        handler.emit(_record("new"))
+    finally:
+        handler.close()
+
+    rotated = list(tmp_path.glob("scraper.log.*.gz"))
+    assert len(rotated) == 1
+    with gzip.open(rotated[0], "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["old"]
+    assert log_file.read_text(encoding="utf-8").splitlines() == ["new"]